@@ -4,11 +4,39 @@ import argparse
 import os
 import sys
 
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version("ndimensionalspectra")
+    except PackageNotFoundError:
+        return "unknown"
+
+class _VersionAction(argparse.Action):
+    """--version that only looks up the installed version when given"""
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help="Show the version and exit."):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f"{parser.prog} {_version()}")
+        parser.exit()
+
+def _serve(host: str, port: int) -> None:
+    # Defer import: keep CLI fast and avoid uvicorn import if not needed
+    import uvicorn
+    from .ontogenic_api import app
+    uvicorn.run(app, host=host, port=port)
+
 def main() -> None:
+    # Fast path: answer --version before building the parser
+    if sys.argv[1:2] == ["--version"]:
+        print(f"ndimensionalspectra {_version()}")
+        return
+
     parser = argparse.ArgumentParser(
         prog="ndimensionalspectra",
         description="Unified entrypoint: CLI (default) or API (--api).",
     )
+    parser.add_argument("--version", action=_VersionAction)
     parser.add_argument(
         "--api", dest="api", action="store_true",
         help="Serve the FastAPI app via Uvicorn."
@@ -28,10 +56,7 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.api:
-        # Defer import: keep CLI fast and avoid uvicorn import if not needed
-        import uvicorn
-        from .ontogenic_api import app
-        uvicorn.run(app, host=args.host, port=args.port)
+        _serve(args.host, args.port)
         return
 
     # Default to CLI mode; forward remaining args to Click group
@@ -42,11 +67,9 @@ def main() -> None:
 
 def main_api() -> None:
     # Helper script entry to run API directly (for pyproject scripts)
-    import uvicorn
-    from .ontogenic_api import app
     host = os.environ.get("HOST", "0.0.0.0")
     port = int(os.environ.get("PORT", "8080"))
-    uvicorn.run(app, host=host, port=port)
+    _serve(host, port)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
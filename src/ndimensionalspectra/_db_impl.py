@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import functools
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any
+from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Text, Index
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import sessionmaker, Session
+
+# Database URL detection
+def _compute_database_url() -> str:
+    if database_url := os.environ.get("DATABASE_URL"):
+        return database_url
+    
+    # SQLite fallback
+    data_dir = "data"
+    os.makedirs(data_dir, exist_ok=True)
+    return f"sqlite:///{data_dir}/om.db"
+
+@functools.lru_cache(maxsize=1)
+def get_database_url() -> str:
+    """Get database URL from environment or fallback to SQLite (resolved once per process)"""
+    return _compute_database_url()
+
+# Resolve the URL once; only the dialect types actually in use are imported
+_DB_URL = get_database_url()
+_IS_PG = "postgresql" in _DB_URL
+_IS_SQLITE = "sqlite" in _DB_URL
+
+if _IS_PG:
+    from sqlalchemy.dialects.postgresql import JSONB as _JSON, UUID as _UUID
+else:
+    # Generic Uuid keeps the CHAR(32) storage used by existing SQLite databases
+    from sqlalchemy import Uuid as _UUID
+    from sqlalchemy.dialects.sqlite import JSON as _JSON
+
+# Engine and session factory (module-level singleton, one pool per process)
+if _IS_SQLITE:
+    _engine_kwargs: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if ":memory:" in _DB_URL or _DB_URL.rstrip("/") == "sqlite:":
+        # In-memory databases live on a single connection
+        from sqlalchemy.pool import StaticPool
+        _engine_kwargs["poolclass"] = StaticPool
+else:
+    _engine_kwargs = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "20")),
+        "pool_pre_ping": True,  # survive DB restarts without 500s
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,  # keep a warm core of connections under bursty load
+    }
+
+engine = create_engine(
+    _DB_URL,
+    echo=False,  # Set to True for SQL debugging
+    insertmanyvalues_page_size=1000,
+    **_engine_kwargs,
+)
+
+if _IS_SQLITE:
+    from sqlalchemy import event
+
+    # Per-connection settings for the embedded fallback: WAL lets readers run
+    # alongside the writer and NORMAL sync leaves one fsync per checkpoint
+    _SQLITE_PRAGMAS = (
+        "PRAGMA foreign_keys=ON",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA wal_autocheckpoint=1000",
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base = declarative_base()
+
+# Database dependency
+def get_db() -> Session:
+    """Dependency to get database session"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# SQLAlchemy Models
+class RunORM(Base):
+    __tablename__ = "runs"
+    
+    # Primary key
+    id = Column(_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    
+    # User and survey metadata
+    user_id = Column(String, nullable=False, index=True)
+    survey_id = Column(String, nullable=False, index=True)
+    passes = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
+    
+    # Coordinates
+    coords2d_x = Column(Float)
+    coords2d_y = Column(Float)
+    coords3d_v = Column(Float)  # valence
+    coords3d_a = Column(Float)  # arousal  
+    coords3d_d = Column(Float)  # dominance
+    
+    # Results
+    stability = Column(Float)
+    scores = Column(_JSON)
+    final_state = Column(_JSON)
+    notes = Column(Text)
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index('idx_user_created', 'user_id', 'created_at'),
+        Index('idx_survey_created', 'survey_id', 'created_at'),
+        # Newest-first covering indexes for the list/compare/projection paths;
+        # INCLUDE lets PostgreSQL answer list columns with an index-only scan
+        Index(
+            'idx_user_created_desc', user_id, created_at.desc(),
+            postgresql_include=['id', 'survey_id', 'passes', 'stability', 'coords2d_x', 'coords2d_y'],
+        ),
+        Index(
+            'idx_survey_created_desc', survey_id, created_at.desc(),
+            postgresql_include=['id', 'user_id', 'passes', 'stability', 'coords2d_x', 'coords2d_y'],
+        ),
+        # Unfiltered listings: matches the (created_at, id) sort and keyset
+        # comparison exactly, so neither needs a sort step
+        Index('idx_created_id_desc', created_at.desc(), id.desc()),
+    )
+
+def init_db():
+    """Initialize database tables"""
+    # SQLite PRAGMAs (foreign keys, WAL, ...) are applied per connection above
+    
+    # Create tables
+    Base.metadata.create_all(bind=engine)
+    
+    # create_all skips existing tables, so add indexes introduced after the
+    # table was first created
+    for index in RunORM.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+# CRUD Operations
+def run_values(
+    user_id: str,
+    survey_id: str,
+    passes: int,
+    pipeline_result: Dict[str, Any],
+    notes: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the column values for one run from a pipeline result"""
+    
+    # Extract data from pipeline result
+    placement = pipeline_result.get("placement", {})
+    scores = pipeline_result.get("scores", {})
+    final_state = pipeline_result.get("final_state", {})
+    
+    # Extract coordinates
+    coords2d = placement.get("coords2d", [])
+    coords3d = placement.get("coords3d", [])
+    
+    # Extract stability from beliefs
+    stability = None
+    if final_state and "beliefs" in final_state:
+        stability = final_state["beliefs"].get("anti_consistent_stability")
+    
+    return {
+        "user_id": user_id,
+        "survey_id": survey_id,
+        "passes": passes,
+        "coords2d_x": coords2d[0] if len(coords2d) > 0 else None,
+        "coords2d_y": coords2d[1] if len(coords2d) > 1 else None,
+        "coords3d_v": coords3d[0] if len(coords3d) > 0 else None,
+        "coords3d_a": coords3d[1] if len(coords3d) > 1 else None,
+        "coords3d_d": coords3d[2] if len(coords3d) > 2 else None,
+        "stability": stability,
+        "scores": scores,
+        "final_state": final_state,
+        "notes": notes,
+    }
+
+def _insert_runs(session: Session, rows: List[Dict[str, Any]]) -> List[RunORM]:
+    from sqlalchemy import insert
+    # ORM bulk INSERT..RETURNING: batched via insertmanyvalues, no per-row
+    # flush, and every column (incl. defaults) comes back without a refresh
+    return session.scalars(insert(RunORM).returning(RunORM), rows).all()
+
+def create_runs_bulk(session: Session, rows: List[Dict[str, Any]]) -> List[RunORM]:
+    """Insert many run records in one transaction (see run_values for the row shape)"""
+    if not rows:
+        return []
+    
+    # One INSERT and one COMMIT in the session's current transaction;
+    # nothing is written if either fails
+    try:
+        runs = _insert_runs(session, rows)
+        # Keep the RETURNING values through this commit so reading the new rows
+        # does not re-SELECT them; other commits on the session still expire
+        expire_on_commit = session.expire_on_commit
+        session.expire_on_commit = False
+        try:
+            session.commit()
+        finally:
+            session.expire_on_commit = expire_on_commit
+    except Exception:
+        session.rollback()
+        raise
+    
+    return runs
+
+def create_run(
+    session: Session, 
+    user_id: str,
+    survey_id: str,
+    passes: int,
+    responses: Dict[str, int],
+    pipeline_result: Dict[str, Any],
+    notes: Optional[str] = None
+) -> RunORM:
+    """Create a new run record"""
+    
+    row = run_values(user_id, survey_id, passes, pipeline_result, notes)
+    return create_runs_bulk(session, [row])[0]
+
+def _run_filters(
+    user_id: Optional[str] = None,
+    survey_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    user_ids: Optional[List[str]] = None
+) -> list:
+    """WHERE clauses shared by the list/stats/projection queries"""
+    filters = []
+    if user_id:
+        filters.append(RunORM.user_id == user_id)
+    if user_ids:
+        filters.append(RunORM.user_id.in_(user_ids))
+    if survey_id:
+        filters.append(RunORM.survey_id == survey_id)
+    if since:
+        filters.append(RunORM.created_at >= since)
+    if until:
+        filters.append(RunORM.created_at <= until)
+    return filters
+
+def _run_columns(include_state: bool) -> list:
+    """Columns for read-only listings; final_state only when asked for"""
+    return [c for c in RunORM.__table__.c if include_state or c.key != "final_state"]
+
+def encode_cursor(run: Any) -> str:
+    """Opaque keyset cursor pointing just past ``run`` in newest-first order"""
+    return f"{run.created_at.isoformat()}|{run.id}"
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Parse a cursor from encode_cursor; raises ValueError if malformed"""
+    created_at, _, run_id = cursor.rpartition("|")
+    return datetime.fromisoformat(created_at), uuid.UUID(run_id)
+
+def list_runs(
+    session: Session,
+    user_id: Optional[str] = None,
+    survey_id: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 50,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    include_state: bool = False,
+    after: Optional[tuple[datetime, uuid.UUID]] = None
+) -> tuple[List[Row], int]:
+    """List runs with filtering and pagination
+    
+    Read-only, so this runs as a Core select and returns ``Row`` objects
+    (attribute access like RunORM, no identity map or instrumentation).
+    Pass ``after`` (a decoded cursor) to seek past a known row instead of
+    using ``page``; deep pages then cost the same as the first one.
+    """
+    
+    from sqlalchemy import select, func, tuple_
+    filters = _run_filters(user_id, survey_id, since, until)
+    
+    # Total rides along as a window over the filtered set: one round trip
+    stmt = select(*_run_columns(include_state), func.count().over().label('total'))
+    stmt = stmt.where(*filters)
+    
+    # Apply pagination and ordering (id breaks created_at ties for the cursor)
+    stmt = stmt.order_by(RunORM.created_at.desc(), RunORM.id.desc())
+    if after:
+        stmt = stmt.where(tuple_(RunORM.created_at, RunORM.id) < tuple_(*after))
+    else:
+        stmt = stmt.offset((page - 1) * page_size)
+    stmt = stmt.limit(page_size)
+    
+    runs = session.execute(stmt).all()
+    
+    if runs and not after:
+        total = runs[0].total
+    elif after or page > 1:
+        # The window only sees rows past the cursor/offset; count separately
+        total = session.execute(select(func.count(RunORM.id)).where(*filters)).scalar()
+    else:
+        total = 0
+    
+    return runs, total
+
+def get_run(session: Session, run_id: str) -> Optional[RunORM]:
+    """Get a single run by ID"""
+    try:
+        key = uuid.UUID(str(run_id))
+    except ValueError:
+        return None
+    return session.get(RunORM, key)
+
+def compare_runs(
+    session: Session,
+    user_ids: List[str],
+    limit_per_user: int = 50,
+    include_state: bool = False
+) -> Dict[str, List[Row]]:
+    """Compare runs across multiple users"""
+    
+    from sqlalchemy import select, func
+    # Rank each user's runs newest-first and keep the top N in one query
+    ranked = select(
+        RunORM.id,
+        func.row_number().over(
+            partition_by=RunORM.user_id,
+            order_by=RunORM.created_at.desc()
+        ).label('rn')
+    ).where(RunORM.user_id.in_(user_ids)).subquery()
+    
+    stmt = select(*_run_columns(include_state)).join(
+        ranked, RunORM.id == ranked.c.id
+    ).where(ranked.c.rn <= limit_per_user)
+    stmt = stmt.order_by(RunORM.user_id, ranked.c.rn)
+    
+    result = {user_id: [] for user_id in user_ids}
+    
+    # Group by user
+    for run in session.execute(stmt):
+        result[run.user_id].append(run)
+    
+    return result
+
+def get_runs_for_projection(
+    session: Session,
+    user_ids: Optional[List[str]] = None,
+    survey_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit_per_user: int = 100
+) -> List[Any]:
+    """Get runs for projection analysis with filtering
+    
+    Returns lightweight rows (attribute access like RunORM) carrying only the
+    columns the projection uses; final_state and the coordinates stay in the DB.
+    """
+    
+    from sqlalchemy import select, func
+    filters = _run_filters(user_ids=user_ids, survey_id=survey_id, since=since, until=until)
+    columns = (RunORM.id, RunORM.user_id, RunORM.created_at, RunORM.stability, RunORM.scores)
+    
+    # Apply per-user limit
+    if user_ids:
+        # Rank within each user over the filtered ids only, then join back
+        ranked = select(
+            RunORM.id,
+            func.row_number().over(
+                partition_by=RunORM.user_id,
+                order_by=RunORM.created_at.desc()
+            ).label('rn')
+        ).where(*filters).subquery()
+        
+        stmt = select(*columns).join(
+            ranked, RunORM.id == ranked.c.id
+        ).where(ranked.c.rn <= limit_per_user)
+    else:
+        stmt = select(*columns).where(*filters).order_by(
+            RunORM.created_at.desc()
+        ).limit(limit_per_user * 10)  # Fallback limit
+    
+    return session.execute(stmt).all()
+
+def get_runs_version(
+    session: Session,
+    user_id: Optional[str] = None,
+    survey_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> tuple[int, Optional[datetime]]:
+    """(count, newest created_at) of matching runs; changes whenever they do"""
+    
+    from sqlalchemy import func
+    
+    filters = _run_filters(user_id, survey_id, since, until)
+    count, newest = session.query(func.count(RunORM.id), func.max(RunORM.created_at)).filter(*filters).one()
+    return count, newest
+
+def get_run_stats(
+    session: Session,
+    user_id: Optional[str] = None,
+    survey_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """Get statistics for runs"""
+    
+    from sqlalchemy import func, distinct
+    
+    filters = _run_filters(user_id, survey_id, since, until)
+    
+    # Counts, date range and averages in a single aggregate pass;
+    # COUNT(DISTINCT) rides along instead of a separate DISTINCT subquery
+    agg = session.query(
+        func.count(RunORM.id).label('total_runs'),
+        func.count(distinct(RunORM.user_id)).label('unique_users'),
+        func.min(RunORM.created_at).label('first_created'),
+        func.max(RunORM.created_at).label('last_created'),
+        func.avg(RunORM.stability).label('avg_stability')
+    ).filter(*filters).one()
+    
+    date_range = {}
+    if agg.total_runs > 0:
+        date_range = {
+            "start": agg.first_created,
+            "end": agg.last_created
+        }
+    
+    # Get runs by user
+    runs_by_user = {}
+    if not user_id:  # Only if not filtering by specific user
+        user_counts = session.query(
+            RunORM.user_id, func.count(RunORM.id)
+        ).filter(*filters).group_by(RunORM.user_id).all()
+        runs_by_user = {user_id: count for user_id, count in user_counts}
+    
+    return {
+        "total_runs": agg.total_runs,
+        "unique_users": agg.unique_users,
+        "date_range": date_range,
+        "mean_stability": float(agg.avg_stability) if agg.avg_stability else None,
+        "runs_by_user": runs_by_user
+    }
+
+def get_score_correlations(
+    session: Session,
+    user_id: Optional[str] = None,
+    survey_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = 1000
+) -> Dict[str, Any]:
+    """Pairwise Pearson correlation of trait scores across the most recent
+    ``limit`` matching runs; ``n_runs`` reports how many were used"""
+    
+    import pandas as pd
+    
+    # Only the scores column leaves the database, newest runs first
+    filters = _run_filters(user_id, survey_id, since, until)
+    rows = session.query(RunORM.scores).filter(*filters, RunORM.scores.isnot(None)).order_by(
+        RunORM.created_at.desc(), RunORM.id.desc()
+    ).limit(limit).all()
+    df = pd.DataFrame.from_records([scores for (scores,) in rows if scores])
+    
+    corr = df.corr() if len(df) >= 2 else pd.DataFrame()
+    return {
+        "columns": corr.columns.tolist(),
+        "matrix": corr.astype(object).where(corr.notna(), None).to_numpy().tolist(),
+        "n_runs": len(df)
+    }
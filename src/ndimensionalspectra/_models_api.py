@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._models_core import RunRecord
+
+class RunList(BaseModel):
+    """Response model for paginated run list"""
+    model_config = ConfigDict(defer_build=True)
+
+    items: List[RunRecord]
+    total: int
+    page: int
+    page_size: int
+    next_cursor: Optional[str] = Field(None, description="Pass as ?cursor= to fetch the next page")
+
+class CompareResponse(BaseModel):
+    """Response model for run comparison"""
+    model_config = ConfigDict(defer_build=True)
+
+    results: Dict[str, List[RunRecord]]
+    total_users: int
+    limit_per_user: int
+
+# Backward compatibility models
+class RunRequest(BaseModel):
+    """Legacy request model for /run endpoint"""
+    responses: Dict[str, int] = Field(..., description="Map of survey item id -> Likert 1..7")
+    passes: int = Field(3, ge=1, le=20)
+    user_id: Optional[str] = Field(None, description="Optional user ID for persistence")
+
+class ScoreRequest(BaseModel):
+    """Request model for scoring responses"""
+    responses: Dict[str, int]
+
+# Visualization models
+class ProjectionRequest(BaseModel):
+    """Request model for projection visualization"""
+    user_ids: Optional[List[str]] = None
+    survey_id: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    dims: int = Field(2, ge=2, le=3, description="Number of dimensions (2 or 3)")
+    technique: str = Field(..., description="Projection technique: pca, umap, or tsne")
+    features: Optional[List[str]] = None
+    limit_per_user: int = Field(100, ge=1, le=1000, description="Maximum runs per user")
+
+class ProjectionPoint(BaseModel):
+    """A single point in a projection"""
+    model_config = ConfigDict(defer_build=True)
+
+    run_id: str
+    user_id: str
+    created_at: datetime
+    x: float
+    y: float
+    z: Optional[float] = None
+    meta: Dict[str, Any] = Field(default_factory=dict)
+
+class ProjectionResult(BaseModel):
+    """Response model for projection visualization"""
+    model_config = ConfigDict(defer_build=True)
+
+    technique: str
+    dims: int
+    points: List[ProjectionPoint]
+    explained_variance: Optional[List[float]] = None
+    feature_names: List[str] = Field(default_factory=list)
+
+class RunStats(BaseModel):
+    """Statistics for runs"""
+    model_config = ConfigDict(defer_build=True)
+
+    total_runs: int
+    unique_users: int
+    date_range: Dict[str, datetime]
+    mean_stability: Optional[float] = None
+    mean_pad: Optional[Dict[str, float]] = None
+    runs_by_user: Dict[str, int] = Field(default_factory=dict)
+
+class ScoreCorrelations(BaseModel):
+    """Trait score correlation matrix"""
+    model_config = ConfigDict(defer_build=True)
+
+    columns: List[str] = Field(default_factory=list)
+    matrix: List[List[Optional[float]]] = Field(default_factory=list, description="Row-major; null where undefined")
+    n_runs: int = Field(0, description="Runs the matrix was computed from (most recent first, capped by limit)")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+class RunCreate(BaseModel):
+    """Request model for creating a new run"""
+    user_id: str = Field(..., description="User identifier")
+    responses: Dict[str, int] = Field(..., description="Map of survey item id -> Likert 1..7")
+    passes: int = Field(3, ge=1, le=20, description="Number of pipeline passes")
+    notes: Optional[str] = Field(None, description="Optional notes for this run")
+
+class RunRecord(BaseModel):
+    """Response model for a run record"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+    id: str
+    user_id: str
+    survey_id: str
+    passes: int
+    created_at: datetime
+    coords2d_x: Optional[float] = None
+    coords2d_y: Optional[float] = None
+    coords3d_v: Optional[float] = None
+    coords3d_a: Optional[float] = None
+    coords3d_d: Optional[float] = None
+    stability: Optional[float] = None
+    scores: Optional[Dict[str, float]] = None
+    final_state: Optional[Dict[str, Any]] = None
+    notes: Optional[str] = None
+
+    @field_validator('id', mode='before')
+    @classmethod
+    def _id_to_str(cls, v: Any) -> str:
+        # ORM rows carry uuid.UUID; coerce here instead of mutating the row
+        return str(v)
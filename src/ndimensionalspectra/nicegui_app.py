@@ -5,18 +5,20 @@ Provides interactive visualization of survey results, projections, and compariso
 """
 
 import os
-import json
-import requests
+import html
+import time
+import asyncio
+import httpx
+from collections import OrderedDict
+import orjson
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import plotly.graph_objects as go
 import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from scipy.stats import gaussian_kde
 
-from nicegui import ui, app
+from nicegui import ui, app, run
 from nicegui.events import ValueChangeEventArguments
 
 # Configuration
@@ -30,6 +32,496 @@ def get_api_base():
         return "http://nginx/api"
     return API_BASE
 
+# Shared async client: one keep-alive connection pool for every loader, so
+# the UI event loop is never blocked on an HTTP round trip
+_client = httpx.AsyncClient(
+    base_url=get_api_base(),
+    timeout=10,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30),
+)
+app.on_shutdown(_client.aclose)
+
+# Shared Plotly config; keeping it identical across updates lets the
+# browser re-use each plot via Plotly.react instead of re-creating it
+PLOT_CONFIG = {"responsive": True, "displaylogo": False}
+
+def with_config(fig) -> Dict[str, Any]:
+    """Figure dict (from a dict or go.Figure) carrying PLOT_CONFIG"""
+    if isinstance(fig, go.Figure):
+        fig = fig.to_plotly_json()
+    return {**fig, "config": PLOT_CONFIG}
+
+# Longest series sent to the browser; longer ones are LTTB-downsampled
+MAX_SERIES_POINTS = int(os.getenv("UI_MAX_SERIES_POINTS", "500"))
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices kept by Largest-Triangle-Three-Buckets downsampling of (x, y).
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the mean of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nhi = edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[hi:nhi].mean(), y[hi:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+# Bins per axis for the diagnostics corner plot histograms
+CORNER_BINS = 40
+
+# Most markers sent per scatter trace; larger clouds are randomly thinned
+MAX_SCATTER_POINTS = int(os.getenv("UI_MAX_SCATTER_POINTS", "5000"))
+
+def thin_scatter(df: pd.DataFrame, n_out: int = MAX_SCATTER_POINTS) -> pd.DataFrame:
+    """Reproducible uniform sample of at most ``n_out`` rows, in original order"""
+    if len(df) <= n_out:
+        return df
+    keep = np.random.default_rng(0).choice(len(df), n_out, replace=False)
+    return df.iloc[np.sort(keep)]
+
+async def post_json(path: str, payload: Any, **kwargs) -> httpx.Response:
+    """POST ``payload`` through the shared client, encoded with orjson"""
+    return await _client.post(
+        path,
+        content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        headers={"Content-Type": "application/json"},
+        **kwargs,
+    )
+
+# Client-side cache for read-only GETs: {(path, params): (fetched_at, etag, body)},
+# in least-recently-used order. Fresh entries are served without a request;
+# stale ones are revalidated with If-None-Match and reused on 304 Not Modified.
+# Entries unused for CACHE_EXPIRE_TTLS TTLs are dropped, and at most
+# CACHE_MAX_ENTRIES are kept.
+CACHE_TTL = float(os.getenv("UI_CACHE_TTL", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("UI_CACHE_MAX_ENTRIES", "256"))
+CACHE_EXPIRE_TTLS = 4
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+def _cached_response(path: str, params: Optional[Dict[str, Any]], etag: Optional[str], body: bytes) -> httpx.Response:
+    headers = {"ETag": etag} if etag else None
+    return httpx.Response(200, headers=headers, content=body, request=_client.build_request("GET", path, params=params))
+
+async def cached_get(path: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    """GET through the shared client with TTL + ETag caching"""
+    key = (path, tuple(sorted((params or {}).items())))
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry and now - entry[0] < CACHE_TTL:
+        _cache.move_to_end(key)
+        return _cached_response(path, params, entry[1], entry[2])
+    
+    headers = {"If-None-Match": entry[1]} if entry and entry[1] else None
+    response = await _client.get(path, params=params, headers=headers)
+    if response.status_code == 304 and entry:
+        etag, body = entry[1], entry[2]
+        response = _cached_response(path, params, etag, body)
+    elif response.status_code == 200:
+        etag, body = response.headers.get("ETag"), response.content
+    else:
+        return response
+    
+    _cache[key] = (now, etag, body)
+    _cache.move_to_end(key)
+    expired = now - CACHE_TTL * CACHE_EXPIRE_TTLS
+    for stale in [k for k, (fetched_at, _, _) in _cache.items() if fetched_at < expired]:
+        del _cache[stale]
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return response
+
+def invalidate_cache(user_id: str):
+    """Drop cached responses that include runs for ``user_id``"""
+    for key in list(_cache):
+        params = dict(key[1])
+        if params.get("user_id") in (None, user_id):
+            del _cache[key]
+
+class RunsLoader:
+    """Coalesces concurrent per-user run fetches into one request.
+
+    ``load`` calls arriving within ``window`` seconds share a single round
+    trip: /runs for one user, /compare for several. Each caller gets that
+    user's newest ``limit`` runs.
+    """
+    
+    def __init__(self, window: float = 0.01, limit: int = 100):
+        self.window = window
+        self.limit = limit
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._task: Optional[asyncio.Task] = None
+    
+    async def load(self, user_id: str) -> List[Dict[str, Any]]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(user_id, []).append(future)
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush())
+        return await future
+    
+    async def _flush(self):
+        await asyncio.sleep(self.window)
+        pending, self._pending, self._task = self._pending, {}, None
+        try:
+            results = await self._fetch(sorted(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for user_id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results.get(user_id, []))
+    
+    async def _fetch(self, user_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        if len(user_ids) == 1:
+            response = await cached_get("/runs", params={"user_id": user_ids[0], "page_size": self.limit})
+            response.raise_for_status()
+            return {user_ids[0]: orjson.loads(response.content).get("items", [])}
+        response = await cached_get("/compare", params={"user_ids": ",".join(user_ids), "limit_per_user": self.limit})
+        response.raise_for_status()
+        return orjson.loads(response.content).get("results", {})
+
+_runs_loader = RunsLoader()
+
+_NUMERIC_RUN_COLUMNS = ["stability", "coords3d_v", "coords3d_a", "coords3d_d", "coords2d_x", "coords2d_y"]
+
+def runs_frame(runs: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Columnar view of API run records, missing coordinates read as 0.
+
+    Numeric columns are float32: plot payloads only need display precision.
+    ``created_at`` is parsed once into naive UTC datetime64.
+    """
+    df = pd.DataFrame(runs)
+    df[_NUMERIC_RUN_COLUMNS] = df.reindex(columns=_NUMERIC_RUN_COLUMNS).fillna(0).astype(np.float32)
+    if "created_at" in df:
+        df["created_at"] = parse_timestamps(df["created_at"])
+    return df
+
+def runs_signature(runs: List[Dict[str, Any]]) -> tuple:
+    """Cheap fingerprint of a run list; runs are immutable once stored"""
+    return tuple(run.get("id") for run in runs)
+
+def user_colors(user_ids: pd.Series, assigned: Dict[str, str]) -> np.ndarray:
+    """Per-point Set1 colour for each user.
+
+    Users missing from ``assigned`` are added to it in order of appearance,
+    so sharing one mapping keeps a user's colour stable across figures.
+    """
+    codes, users = pd.factorize(user_ids)
+    palette = px.colors.qualitative.Set1
+    for user_id in users:
+        if user_id not in assigned:
+            assigned[user_id] = palette[len(assigned) % len(palette)]
+    lut = np.array([assigned[user_id] for user_id in users], dtype=object)
+    return lut[codes]
+
+def parse_timestamps(values) -> pd.DatetimeIndex:
+    """Parse ISO-8601 strings (any offset or 'Z') to naive UTC timestamps"""
+    return pd.DatetimeIndex(pd.to_datetime(values, utc=True, format="ISO8601", errors="coerce")).tz_localize(None)
+
+def kde2d(xs: np.ndarray, ys: np.ndarray, gx: np.ndarray, gy: np.ndarray) -> Optional[np.ndarray]:
+    """Gaussian KDE of the points (xs, ys) evaluated on the gx-by-gy grid.
+
+    Same estimator as scipy's gaussian_kde (data covariance scaled by the
+    2-D Silverman/Scott factor n**-1/6), computed as a binned KDE: points
+    are linearly binned onto the (evenly spaced) grid and convolved with
+    the kernel by FFT, so the cost no longer grows with n times grid size.
+    Returns a (gy.size, gx.size) array, or None when the points are
+    (nearly) colinear and have no 2-D density.
+    """
+    n = len(xs)
+    cov = np.cov(xs, ys) * n ** (-1 / 3)
+    det = np.linalg.det(cov)
+    if not det > 1e-12:
+        return None
+    inv = np.linalg.inv(cov)
+    mx, my = gx.size, gy.size
+    hx, hy = gx[1] - gx[0], gy[1] - gy[0]
+    
+    # Linear binning: each point spreads its unit weight over 4 grid nodes
+    fx, fy = (xs - gx[0]) / hx, (ys - gy[0]) / hy
+    ix = np.clip(np.floor(fx).astype(int), 0, mx - 2)
+    iy = np.clip(np.floor(fy).astype(int), 0, my - 2)
+    wx, wy = fx - ix, fy - iy
+    counts = np.zeros((my, mx))
+    np.add.at(counts, (iy, ix), (1 - wy) * (1 - wx))
+    np.add.at(counts, (iy, ix + 1), (1 - wy) * wx)
+    np.add.at(counts, (iy + 1, ix), wy * (1 - wx))
+    np.add.at(counts, (iy + 1, ix + 1), wy * wx)
+    
+    # Kernel sampled at every grid offset, then a zero-padded FFT convolution
+    kx = np.arange(1 - mx, mx) * hx
+    ky = (np.arange(1 - my, my) * hy)[:, None]
+    kernel = np.exp(-0.5 * (inv[0, 0] * kx * kx + 2 * inv[0, 1] * kx * ky + inv[1, 1] * ky * ky))
+    shape = (3 * my - 2, 3 * mx - 2)
+    Z = np.fft.irfft2(np.fft.rfft2(counts, shape) * np.fft.rfft2(kernel, shape), shape)
+    return Z[my - 1:2 * my - 1, mx - 1:2 * mx - 1] / (n * 2 * np.pi * np.sqrt(det))
+
+def pad_3d_figure(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """3D PAD scatter of the runs"""
+    if df.empty:
+        return None
+
+    # Extract PAD coordinates
+    x_coords = df["coords3d_v"].to_numpy()
+    y_coords = df["coords3d_a"].to_numpy()
+    z_coords = df["coords3d_d"].to_numpy()
+    dates = df["created_at"].to_numpy()
+
+    # Plain dict figure: skips plotly.py's per-trace validation
+    fig = {
+        "data": [{
+            "type": "scatter3d",
+            "x": x_coords, "y": y_coords, "z": z_coords,
+            "mode": "markers",
+            "marker": {
+                "size": 8,
+                "color": np.arange(len(df), dtype=np.int32),
+                "colorscale": "Viridis",
+                "opacity": 0.8
+            },
+            "text": dates,
+            "hovertemplate": '<b>Date:</b> %{text}<br>' +
+                             '<b>Valence:</b> %{x:.3f}<br>' +
+                             '<b>Arousal:</b> %{y:.3f}<br>' +
+                             '<b>Dominance:</b> %{z:.3f}<extra></extra>'
+        }],
+        "layout": {
+            "title": {"text": "3D PAD Space"},
+            "scene": {
+                "xaxis": {"title": {"text": "Valence"}},
+                "yaxis": {"title": {"text": "Arousal"}},
+                "zaxis": {"title": {"text": "Dominance"}}
+            },
+            "height": 400
+        }
+    }
+
+    return fig
+
+def pad_2d_figure(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """2D PAD scatter with a density contour"""
+    if df.empty:
+        return None
+
+    # Extract 2D coordinates
+    x_coords = df["coords2d_x"].to_numpy()
+    y_coords = df["coords2d_y"].to_numpy()
+    dates = df["created_at"].to_numpy()
+
+    # Add scatter plot
+    data = [{
+        "type": "scattergl",
+        "x": x_coords, "y": y_coords,
+        "mode": "markers",
+        "marker": {
+            "size": 10,
+            "color": np.arange(len(df), dtype=np.int32),
+            "colorscale": "Viridis",
+            "opacity": 0.7
+        },
+        "text": dates,
+        "hovertemplate": '<b>Date:</b> %{text}<br>' +
+                         '<b>X:</b> %{x:.3f}<br>' +
+                         '<b>Y:</b> %{y:.3f}<extra></extra>',
+        "name": "Runs"
+    }]
+
+    # Add density contour if enough points
+    if len(df) > 5:
+        # Create density estimation
+        x_range = np.linspace(x_coords.min(), x_coords.max(), 50)
+        y_range = np.linspace(y_coords.min(), y_coords.max(), 50)
+
+        # Simple kernel density estimation; skipped for colinear points
+        Z = kde2d(x_coords, y_coords, x_range, y_range)
+        if Z is not None:
+            data.append({
+                "type": "contour",
+                "x": x_range, "y": y_range, "z": Z,
+                "colorscale": "Blues",
+                "opacity": 0.3,
+                "showscale": False,
+                "name": "Density"
+            })
+
+    fig = {
+        "data": data,
+        "layout": {
+            "title": {"text": "2D PAD with Density"},
+            "xaxis": {"title": {"text": "X"}},
+            "yaxis": {"title": {"text": "Y"}},
+            "height": 350
+        }
+    }
+
+    return fig
+
+def radar_figure(runs: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Radar chart of the latest run's traits against the cohort average"""
+    if not runs or not runs[0].get("scores"):
+        return None
+
+    # Get latest run scores
+    latest_scores = runs[0]["scores"]
+    traits = list(latest_scores.keys())
+    values = list(latest_scores.values())
+
+    data = [{
+        "type": "scatterpolar",
+        "r": values,
+        "theta": traits,
+        "fill": "toself",
+        "name": "Current Run"
+    }]
+
+    # Add cohort average if multiple runs
+    if len(runs) > 1:
+        scores_df = pd.DataFrame([run["scores"] for run in runs if run.get("scores")])
+        avg_scores = scores_df.reindex(columns=traits).fillna(0).mean()
+
+        if not avg_scores.empty:
+            data.append({
+                "type": "scatterpolar",
+                "r": avg_scores.to_numpy(),
+                "theta": traits,
+                "fill": "toself",
+                "name": "Cohort Average"
+            })
+
+    fig = {
+        "data": data,
+        "layout": {
+            "polar": {
+                "radialaxis": {
+                    "visible": True,
+                    "range": [-1, 1]
+                }},
+            "showlegend": True,
+            "title": {"text": "Trait Radar Chart"},
+            "height": 350
+        }
+    }
+
+    return fig
+
+def stability_figure(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """Stability time series"""
+    if df.empty:
+        return None
+
+    stabilities = df["stability"].to_numpy()
+
+    date_objects = df["created_at"].to_numpy()
+
+    keep = lttb_indices(date_objects.astype(np.int64), stabilities, MAX_SERIES_POINTS)
+    date_objects, stabilities = date_objects[keep], stabilities[keep]
+
+    fig = {
+        "data": [{
+            "type": "scattergl",
+            "x": date_objects,
+            "y": stabilities,
+            "mode": "lines+markers",
+            "name": "Stability",
+            "line": {"color": "blue", "width": 2},
+            "marker": {"size": 8, "color": "blue"}
+        }],
+        "layout": {
+            "title": {"text": "Stability Over Time"},
+            "xaxis": {"title": {"text": "Date"}},
+            "yaxis": {"title": {"text": "Stability"}},
+            "height": 350
+        }
+    }
+
+    return fig
+
+def trajectory_figure(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """PAD trajectory with direction arrows"""
+    if df.empty:
+        return None
+
+    x_coords = df["coords2d_x"].to_numpy()
+    y_coords = df["coords2d_y"].to_numpy()
+    keep = lttb_indices(x_coords, y_coords, MAX_SERIES_POINTS)
+    x_coords, y_coords = x_coords[keep], y_coords[keep]
+
+    # Direction arrows: one marker per step at the segment midpoint,
+    # rotated along it (marker angles are clockwise from north)
+    dx, dy = np.diff(x_coords), np.diff(y_coords)
+    arrows = {
+        "type": "scatter",
+        "x": (x_coords[:-1] + x_coords[1:]) / 2,
+        "y": (y_coords[:-1] + y_coords[1:]) / 2,
+        "mode": "markers",
+        "marker": {
+            "symbol": "arrow",
+            "angle": 90 - np.degrees(np.arctan2(dy, dx)),
+            "size": 12,
+            "color": "red"
+        },
+        "hoverinfo": "skip",
+        "showlegend": False
+    }
+
+    fig = {
+        "data": [{
+            "type": "scattergl",
+            "x": x_coords, "y": y_coords,
+            "mode": "lines+markers",
+            "name": "Trajectory",
+            "line": {"color": "red", "width": 2},
+            "marker": {"size": 8, "color": "red"}
+        }, arrows],
+        "layout": {
+            "title": {"text": "PAD Trajectory"},
+            "xaxis": {"title": {"text": "X"}},
+            "yaxis": {"title": {"text": "Y"}},
+            "height": 350
+        }
+    }
+
+    return fig
+
+def dashboard_figures(runs: List[Dict[str, Any]]) -> tuple:
+    """(3D PAD, 2D PAD, radar) figure dicts for the dashboard; None where empty"""
+    # Columnar view built once and shared by the PAD plots
+    df = runs_frame(runs)
+    return pad_3d_figure(df), pad_2d_figure(df), radar_figure(runs)
+
+def history_figures(runs: List[Dict[str, Any]]) -> tuple:
+    """(stability, trajectory) figure dicts for the history tab; None where empty"""
+    # Sorted once by date for both time-ordered plots
+    df = runs_frame(runs).sort_values("created_at", kind="stable")
+    return stability_figure(df), trajectory_figure(df)
+
+async def build_off_loop(builder, *args):
+    """Run a pure figure builder in NiceGUI's process pool.
+
+    Falls back to the thread pool where no process pool could be started.
+    Returns None if the app is shutting down.
+    """
+    if run.process_pool is None:
+        return await run.io_bound(builder, *args)
+    return await run.cpu_bound(builder, *args)
+
 class NDSpectraUI:
     """Main UI class for N-Dimensional Spectra visualization"""
     
@@ -56,6 +548,13 @@ class NDSpectraUI:
         self.compare_data = {}
         self.embeddings_data = {}
         
+        # (tab name, user id) pairs whose data has already been fetched
+        self._loaded = set()
+        # Input fingerprint of what each plot group currently shows
+        self._plot_sig = {}
+        # Colour of each user seen so far, shared by every per-user figure
+        self._user_color = {}
+        
     def create_ui(self):
         """Create the main UI with tabs"""
         ui.add_head_html('<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">')
@@ -67,7 +566,7 @@ class NDSpectraUI:
             self.create_config_section()
             
             # Main tabs
-            with ui.tabs().classes('w-full') as tabs:
+            with ui.tabs(on_change=self.on_tab_change).classes('w-full') as tabs:
                 survey_tab = ui.tab('Survey', icon='quiz')
                 dashboard_tab = ui.tab('Dashboard', icon='dashboard')
                 history_tab = ui.tab('History', icon='history')
@@ -122,19 +621,22 @@ class NDSpectraUI:
             with ui.card().classes("w-full"):
                 ui.html('<h3 class="text-lg font-semibold mb-4">Survey Questions</h3>')
                 
+                self.survey_container = ui.column().classes("w-full")
+                with self.survey_container:
+                    if not self.survey_data:
+                        ui.label("Loading survey...").classes("text-gray-500")
+                    else:
+                        self.render_survey_items()
                 if not self.survey_data:
-                    ui.label("Loading survey...").classes("text-gray-500")
-                    self.load_survey()
-                else:
-                    self.render_survey_items()
+                    ui.timer(0, self.load_survey, once=True)
+                ui.on("survey_response", lambda e: self.update_response(e.args["id"], int(e.args["value"])))
             
             # Submit button
             with ui.row().classes("w-full justify-center"):
                 ui.button("Run Survey Analysis", on_click=self.submit_survey).classes("bg-blue-500 text-white px-8 py-3")
             
-            # Results display
-            if self.result:
-                self.display_survey_results()
+            # Results display; refreshed on its own after each submit
+            self.display_survey_results()
     
     def create_dashboard_tab(self):
         """Create dashboard with 3D PAD scatter and other visualizations"""
@@ -156,9 +658,6 @@ class NDSpectraUI:
             with ui.card().classes("w-full"):
                 ui.html('<h3 class="text-lg font-semibold mb-4">Trait Radar</h3>')
                 self.radar_plot = ui.plotly({}).classes("w-full h-80")
-            
-            # Load dashboard data
-            self.load_dashboard_data()
     
     def create_history_tab(self):
         """Create history tab with time series and trajectory plots"""
@@ -186,9 +685,6 @@ class NDSpectraUI:
                     ],
                     'rowData': []
                 }).classes("w-full h-64")
-            
-            # Load history data
-            self.load_history_data()
     
     def create_compare_tab(self):
         """Create compare tab for multi-user analysis"""
@@ -253,9 +749,6 @@ class NDSpectraUI:
             with ui.card().classes("w-full"):
                 ui.html('<h3 class="text-lg font-semibold mb-4">Outlier Analysis</h3>')
                 self.outlier_plot = ui.plotly({}).classes("w-full h-80")
-            
-            # Load diagnostics data
-            self.load_diagnostics_data()
 
     # Event handlers and data loading methods will be implemented next...
     
@@ -285,52 +778,69 @@ class NDSpectraUI:
         """Handle projection dimensions change"""
         self.embeddings_data["dims"] = int(e.value)
     
+    async def on_tab_change(self, e: ValueChangeEventArguments):
+        """Load a tab's data the first time it is opened for the current user"""
+        name = e.value.props["name"] if isinstance(e.value, ui.tab) else e.value
+        loader = {
+            "Dashboard": self.load_dashboard_data,
+            "History": self.load_history_data,
+            "Diagnostics": self.load_diagnostics_data,
+        }.get(name)
+        key = (name, self.user_id)
+        if loader is None or key in self._loaded:
+            return
+        self._loaded.add(key)
+        await loader()
+    
     # Data Loading Methods
-    def load_survey(self):
+    async def load_survey(self):
         """Load survey data from API"""
         try:
-            response = requests.get(f"{get_api_base()}/survey", timeout=10)
+            response = await cached_get("/survey")
             if response.status_code == 200:
-                self.survey_data = response.json()
+                self.survey_data = orjson.loads(response.content)
                 # Initialize responses with default values
                 self.responses = {item["id"]: 4 for item in self.survey_data.get("items", [])}
                 print(f"Initialized {len(self.responses)} responses with default values")
-                self.render_survey_items()
+                self.survey_container.clear()
+                with self.survey_container:
+                    self.render_survey_items()
             else:
                 ui.notify("Failed to load survey", type="error")
         except Exception as e:
             ui.notify(f"Failed to load survey: {str(e)}", type="error")
     
     def render_survey_items(self):
-        """Render survey items with Likert sliders"""
+        """Render survey items with Likert sliders.
+
+        All items go into one ui.html grid of native range inputs; each input
+        reports its value through the page-level 'survey_response' event.
+        """
         if not self.survey_data or "items" not in self.survey_data:
             return
         
+        lo = self.survey_data.get("scale_min", 1)
+        hi = self.survey_data.get("scale_max", 7)
+        parts = ['<div class="grid w-full items-center gap-x-4 gap-y-3" style="grid-template-columns: 1fr auto 2fr auto">']
         for item in self.survey_data["items"]:
-            item_id = item["id"]
-            with ui.card().classes("w-full mb-4"):
-                with ui.row().classes("w-full items-center gap-4"):
-                    with ui.column().classes("flex-1"):
-                        ui.label(item["text"]).classes("text-sm font-medium")
-                    
-                    with ui.column().classes("flex-none"):
-                        ui.label("1").classes("text-xs text-gray-500")
-                    
-                    with ui.column().classes("flex-1"):
-                        slider = ui.slider(
-                            min=1, max=7, value=4, step=1,
-                            on_change=lambda e, id=item_id: self.update_response(id, e.value)
-                        ).classes("w-full")
-                    
-                    with ui.column().classes("flex-none"):
-                        ui.label("7").classes("text-xs text-gray-500")
+            item_id = html.escape(orjson.dumps(item["id"]).decode())
+            parts.append(
+                f'<div class="text-sm font-medium">{html.escape(item["prompt"])}</div>'
+                f'<span class="text-xs text-gray-500">{lo}</span>'
+                f'<input type="range" class="w-full" min="{lo}" max="{hi}" step="1" '
+                f'value="{self.responses.get(item["id"], 4)}" '
+                f'onchange="emitEvent(\'survey_response\', {{id: {item_id}, value: this.valueAsNumber}})">'
+                f'<span class="text-xs text-gray-500">{hi}</span>'
+            )
+        parts.append('</div>')
+        ui.html("".join(parts)).classes("w-full")
     
     def update_response(self, item_id: str, value: int):
         """Update response for a survey item"""
         self.responses[item_id] = value
         print(f"Updated response for {item_id}: {value}")
     
-    def submit_survey(self):
+    async def submit_survey(self):
         """Submit survey responses to API with persistence"""
         if not self.user_id:
             ui.notify("Please enter a user ID", type="warning")
@@ -344,25 +854,22 @@ class NDSpectraUI:
                 "notes": self.notes
             }
             
-            response = requests.post(
-                f"{get_api_base()}/runs",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
+            response = await post_json("/runs", payload, timeout=30)
             
             if response.status_code == 200:
-                self.result = response.json()
+                self.result = orjson.loads(response.content)
                 ui.notify("Survey submitted successfully!", type="positive")
+                self.display_survey_results.refresh()
+                invalidate_cache(self.user_id)
                 # Refresh dashboard and history data
-                self.load_dashboard_data()
-                self.load_history_data()
+                await asyncio.gather(self.load_dashboard_data(), self.load_history_data())
             else:
                 ui.notify(f"Failed to submit survey: {response.text}", type="error")
                 
         except Exception as e:
             ui.notify(f"Error submitting survey: {str(e)}", type="error")
     
+    @ui.refreshable_method
     def display_survey_results(self):
         """Display survey results"""
         if not self.result:
@@ -384,33 +891,23 @@ class NDSpectraUI:
             ui.label(summary).classes("text-sm text-gray-700")
     
     # Dashboard Methods
-    def load_dashboard_data(self):
+    async def load_dashboard_data(self):
         """Load data for dashboard visualizations"""
         if not self.user_id:
             return
         
         try:
-            # Load user's runs
-            response = requests.get(
-                f"{get_api_base()}/runs",
-                params={"user_id": self.user_id, "page_size": 100},
-                timeout=10
+            # Load user's runs and stats concurrently
+            runs, stats_response = await asyncio.gather(
+                _runs_loader.load(self.user_id),
+                cached_get("/runs/stats", params={"user_id": self.user_id}),
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                self.dashboard_data["runs"] = data.get("items", [])
-                self.update_dashboard_plots()
-            
-            # Load stats
-            stats_response = requests.get(
-                f"{get_api_base()}/runs/stats",
-                params={"user_id": self.user_id},
-                timeout=10
-            )
+            self.dashboard_data["runs"] = runs
+            await self.update_dashboard_plots()
             
             if stats_response.status_code == 200:
-                self.stats_data = stats_response.json()
+                self.stats_data = orjson.loads(stats_response.content)
                 self.update_stats_cards()
                 
         except Exception as e:
@@ -428,6 +925,10 @@ class NDSpectraUI:
         if not self.stats_data:
             return
         
+        # Replace, rather than append to, the previous refresh's content
+        for card in (self.total_runs_card, self.avg_stability_card, self.date_range_card):
+            card.clear()
+        
         # Total runs
         with self.total_runs_card:
             ui.html('<div class="text-center">')
@@ -446,8 +947,7 @@ class NDSpectraUI:
         # Date range
         date_range = self.stats_data.get("date_range", {})
         if date_range:
-            start_date = datetime.fromisoformat(date_range["start"].replace("Z", "+00:00")).strftime("%Y-%m-%d")
-            end_date = datetime.fromisoformat(date_range["end"].replace("Z", "+00:00")).strftime("%Y-%m-%d")
+            start_date, end_date = parse_timestamps([date_range["start"], date_range["end"]]).strftime("%Y-%m-%d")
             
             with self.date_range_card:
                 ui.html('<div class="text-center">')
@@ -455,286 +955,52 @@ class NDSpectraUI:
                 ui.html(f'<div class="text-sm text-gray-600">to {end_date}</div>')
                 ui.html('</div>')
     
-    def update_dashboard_plots(self):
+    async def update_dashboard_plots(self):
         """Update dashboard plots with data"""
         if not self.dashboard_data.get("runs"):
             return
-        
-        runs = self.dashboard_data["runs"]
-        
-        # 3D PAD Scatter
-        self.update_pad_3d_plot(runs)
-        
-        # 2D PAD with Density
-        self.update_pad_2d_plot(runs)
-        
-        # Radar chart
-        self.update_radar_plot(runs)
-    
-    def update_pad_3d_plot(self, runs):
-        """Update 3D PAD scatter plot"""
-        if not runs:
-            return
-        
-        # Extract PAD coordinates
-        x_coords = [run.get("coords3d_v", 0) for run in runs]
-        y_coords = [run.get("coords3d_a", 0) for run in runs]
-        z_coords = [run.get("coords3d_d", 0) for run in runs]
-        dates = [run.get("created_at", "") for run in runs]
-        
-        fig = go.Figure(data=[go.Scatter3d(
-            x=x_coords, y=y_coords, z=z_coords,
-            mode='markers',
-            marker=dict(
-                size=8,
-                color=[i for i in range(len(runs))],
-                colorscale='Viridis',
-                opacity=0.8
-            ),
-            text=dates,
-            hovertemplate='<b>Date:</b> %{text}<br>' +
-                         '<b>Valence:</b> %{x:.3f}<br>' +
-                         '<b>Arousal:</b> %{y:.3f}<br>' +
-                         '<b>Dominance:</b> %{z:.3f}<extra></extra>'
-        )])
-        
-        fig.update_layout(
-            title="3D PAD Space",
-            scene=dict(
-                xaxis_title="Valence",
-                yaxis_title="Arousal", 
-                zaxis_title="Dominance"
-            ),
-            height=400
-        )
-        
-        self.pad_3d_plot.options = fig.to_dict()
-    
-    def update_pad_2d_plot(self, runs):
-        """Update 2D PAD scatter with density"""
-        if not runs:
-            return
-        
-        # Extract 2D coordinates
-        x_coords = [run.get("coords2d_x", 0) for run in runs]
-        y_coords = [run.get("coords2d_y", 0) for run in runs]
-        dates = [run.get("created_at", "") for run in runs]
-        
-        fig = go.Figure()
-        
-        # Add scatter plot
-        fig.add_trace(go.Scatter(
-            x=x_coords, y=y_coords,
-            mode='markers',
-            marker=dict(
-                size=10,
-                color=[i for i in range(len(runs))],
-                colorscale='Viridis',
-                opacity=0.7
-            ),
-            text=dates,
-            hovertemplate='<b>Date:</b> %{text}<br>' +
-                         '<b>X:</b> %{x:.3f}<br>' +
-                         '<b>Y:</b> %{y:.3f}<extra></extra>',
-            name="Runs"
-        ))
-        
-        # Add density contour if enough points
-        if len(runs) > 5:
-            try:
-                # Create density estimation
-                x_range = np.linspace(min(x_coords), max(x_coords), 50)
-                y_range = np.linspace(min(y_coords), max(y_coords), 50)
-                X, Y = np.meshgrid(x_range, y_range)
-                
-                # Simple kernel density estimation
-                positions = np.vstack([X.ravel(), Y.ravel()])
-                values = np.vstack([x_coords, y_coords])
-                kernel = gaussian_kde(values)
-                Z = np.reshape(kernel(positions).T, X.shape)
-                
-                fig.add_trace(go.Contour(
-                    x=x_range, y=y_range, z=Z,
-                    colorscale='Blues',
-                    opacity=0.3,
-                    showscale=False,
-                    name="Density"
-                ))
-            except:
-                pass  # Skip density if calculation fails
-        
-        fig.update_layout(
-            title="2D PAD with Density",
-            xaxis_title="X",
-            yaxis_title="Y",
-            height=350
-        )
-        
-        self.pad_2d_plot.options = fig.to_dict()
-    
-    def update_radar_plot(self, runs):
-        """Update radar chart for traits"""
-        if not runs or not runs[0].get("scores"):
+        sig = runs_signature(self.dashboard_data["runs"])
+        if self._plot_sig.get("dashboard") == sig:
             return
         
-        # Get latest run scores
-        latest_scores = runs[0]["scores"]
-        traits = list(latest_scores.keys())
-        values = list(latest_scores.values())
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatterpolar(
-            r=values,
-            theta=traits,
-            fill='toself',
-            name='Current Run'
-        ))
-        
-        # Add cohort average if multiple runs
-        if len(runs) > 1:
-            avg_scores = {}
-            for trait in traits:
-                trait_values = [run.get("scores", {}).get(trait, 0) for run in runs if run.get("scores")]
-                if trait_values:
-                    avg_scores[trait] = np.mean(trait_values)
-            
-            if avg_scores:
-                fig.add_trace(go.Scatterpolar(
-                    r=list(avg_scores.values()),
-                    theta=list(avg_scores.keys()),
-                    fill='toself',
-                    name='Cohort Average'
-                ))
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[-1, 1]
-                )),
-            showlegend=True,
-            title="Trait Radar Chart",
-            height=350
-        )
-        
-        self.radar_plot.options = fig.to_dict()
+        # 3D PAD scatter, 2D PAD with density and radar chart, built off the event loop
+        figures = await build_off_loop(dashboard_figures, self.dashboard_data["runs"])
+        for plot, fig in zip((self.pad_3d_plot, self.pad_2d_plot, self.radar_plot), figures or ()):
+            if fig is not None:
+                plot.update_figure(with_config(fig))
+        self._plot_sig["dashboard"] = sig
     
     # History Methods
-    def load_history_data(self):
+    async def load_history_data(self):
         """Load data for history visualizations"""
         if not self.user_id:
             return
         
         try:
-            response = requests.get(
-                f"{get_api_base()}/runs",
-                params={"user_id": self.user_id, "page_size": 100},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                self.history_data["runs"] = data.get("items", [])
-                self.update_history_plots()
+            self.history_data["runs"] = await _runs_loader.load(self.user_id)
+            await self.update_history_plots()
                 
         except Exception as e:
             print(f"Error loading history data: {e}")
     
-    def update_history_plots(self):
+    async def update_history_plots(self):
         """Update history plots"""
         runs = self.history_data.get("runs", [])
         if not runs:
             return
+        sig = runs_signature(runs)
+        if self._plot_sig.get("history") == sig:
+            return
         
-        # Update stability plot
-        self.update_stability_plot(runs)
-        
-        # Update trajectory plot
-        self.update_trajectory_plot(runs)
+        # Stability and trajectory plots, built off the event loop
+        figures = await build_off_loop(history_figures, runs)
+        for plot, fig in zip((self.stability_plot, self.trajectory_plot), figures or ()):
+            if fig is not None:
+                plot.update_figure(with_config(fig))
         
         # Update runs table
         self.update_runs_table(runs)
-    
-    def update_stability_plot(self, runs):
-        """Update stability time series plot"""
-        if not runs:
-            return
-        
-        # Sort by date
-        runs_sorted = sorted(runs, key=lambda x: x.get("created_at", ""))
-        
-        dates = [run.get("created_at", "") for run in runs_sorted]
-        stabilities = [run.get("stability", 0) for run in runs_sorted]
-        
-        # Convert dates to datetime
-        try:
-            date_objects = [datetime.fromisoformat(date.replace("Z", "+00:00")) for date in dates]
-        except:
-            date_objects = list(range(len(dates)))
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=date_objects,
-            y=stabilities,
-            mode='lines+markers',
-            name='Stability',
-            line=dict(color='blue', width=2),
-            marker=dict(size=8, color='blue')
-        ))
-        
-        fig.update_layout(
-            title="Stability Over Time",
-            xaxis_title="Date",
-            yaxis_title="Stability",
-            height=350
-        )
-        
-        self.stability_plot.options = fig.to_dict()
-    
-    def update_trajectory_plot(self, runs):
-        """Update PAD trajectory plot"""
-        if not runs:
-            return
-        
-        # Sort by date
-        runs_sorted = sorted(runs, key=lambda x: x.get("created_at", ""))
-        
-        x_coords = [run.get("coords2d_x", 0) for run in runs_sorted]
-        y_coords = [run.get("coords2d_y", 0) for run in runs_sorted]
-        dates = [run.get("created_at", "") for run in runs_sorted]
-        
-        fig = go.Figure()
-        
-        # Add trajectory line
-        fig.add_trace(go.Scatter(
-            x=x_coords, y=y_coords,
-            mode='lines+markers',
-            name='Trajectory',
-            line=dict(color='red', width=2),
-            marker=dict(size=8, color='red')
-        ))
-        
-        # Add arrows for direction
-        for i in range(len(x_coords) - 1):
-            fig.add_annotation(
-                x=x_coords[i], y=y_coords[i],
-                ax=x_coords[i+1], ay=y_coords[i+1],
-                xref="x", yref="y",
-                axref="x", ayref="y",
-                text="", showarrow=True,
-                arrowhead=2, arrowsize=1, arrowwidth=2, arrowcolor="red"
-            )
-        
-        fig.update_layout(
-            title="PAD Trajectory",
-            xaxis_title="X",
-            yaxis_title="Y",
-            height=350
-        )
-        
-        self.trajectory_plot.options = fig.to_dict()
+        self._plot_sig["history"] = sig
     
     def update_runs_table(self, runs):
         """Update runs table"""
@@ -755,7 +1021,7 @@ class NDSpectraUI:
         self.runs_table.options['rowData'] = table_data
     
     # Compare Methods
-    def load_compare_data(self):
+    async def load_compare_data(self):
         """Load comparison data"""
         if not self.filters["user_ids"]:
             ui.notify("Please select users to compare", type="warning")
@@ -763,14 +1029,10 @@ class NDSpectraUI:
         
         try:
             user_ids_str = ",".join(self.filters["user_ids"])
-            response = requests.get(
-                f"{get_api_base()}/compare",
-                params={"user_ids": user_ids_str, "limit_per_user": 50},
-                timeout=10
-            )
+            response = await _client.get("/compare", params={"user_ids": user_ids_str, "limit_per_user": 50})
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.compare_data = data.get("results", {})
                 self.update_compare_plots()
             else:
@@ -783,134 +1045,137 @@ class NDSpectraUI:
         """Update comparison plots"""
         if not self.compare_data:
             return
+        sig = tuple((user_id, runs_signature(runs)) for user_id, runs in self.compare_data.items())
+        if self._plot_sig.get("compare") == sig:
+            return
+        
+        # All users' runs flattened once for both scatters
+        df = runs_frame([run for runs in self.compare_data.values() for run in runs])
         
         # Update 2D comparison
-        self.update_compare_2d_plot()
+        self.update_compare_2d_plot(df)
         
         # Update 3D comparison
-        self.update_compare_3d_plot()
+        self.update_compare_3d_plot(df)
         
         # Update parallel coordinates
         self.update_parallel_plot()
+        self._plot_sig["compare"] = sig
     
-    def update_compare_2d_plot(self):
+    def update_compare_2d_plot(self, df):
         """Update 2D comparison scatter"""
-        if not self.compare_data:
+        if df.empty:
             return
         
-        fig = go.Figure()
-        
-        colors = px.colors.qualitative.Set1
-        for i, (user_id, runs) in enumerate(self.compare_data.items()):
-            if not runs:
-                continue
-            
-            x_coords = [run.get("coords2d_x", 0) for run in runs]
-            y_coords = [run.get("coords2d_y", 0) for run in runs]
-            
-            fig.add_trace(go.Scatter(
-                x=x_coords, y=y_coords,
-                mode='markers',
-                name=user_id,
-                marker=dict(
-                    size=8,
-                    color=colors[i % len(colors)],
-                    opacity=0.7
-                )
-            ))
-        
-        fig.update_layout(
-            title="2D Comparison by User",
-            xaxis_title="X",
-            yaxis_title="Y",
-            height=350
-        )
+        df = thin_scatter(df)
+        # One WebGL trace for every user, coloured per point by user
+        fig = {
+            "data": [{
+                "type": "scattergl",
+                "x": df["coords2d_x"].to_numpy(), "y": df["coords2d_y"].to_numpy(),
+                "mode": "markers",
+                "text": df["user_id"].to_numpy(),
+                "hovertemplate": '<b>%{text}</b><br>X: %{x:.3f}<br>Y: %{y:.3f}<extra></extra>',
+                "marker": {
+                    "size": 8,
+                    "color": user_colors(df["user_id"], self._user_color),
+                    "opacity": 0.7
+                }
+            }],
+            "layout": {
+                "title": {"text": "2D Comparison by User"},
+                "xaxis": {"title": {"text": "X"}},
+                "yaxis": {"title": {"text": "Y"}},
+                "height": 350
+            }
+        }
         
-        self.compare_2d_plot.options = fig.to_dict()
+        self.compare_2d_plot.update_figure(with_config(fig))
     
-    def update_compare_3d_plot(self):
+    def update_compare_3d_plot(self, df):
         """Update 3D comparison scatter"""
-        if not self.compare_data:
+        if df.empty:
             return
         
-        fig = go.Figure()
-        
-        colors = px.colors.qualitative.Set1
-        for i, (user_id, runs) in enumerate(self.compare_data.items()):
-            if not runs:
-                continue
-            
-            x_coords = [run.get("coords3d_v", 0) for run in runs]
-            y_coords = [run.get("coords3d_a", 0) for run in runs]
-            z_coords = [run.get("coords3d_d", 0) for run in runs]
-            
-            fig.add_trace(go.Scatter3d(
-                x=x_coords, y=y_coords, z=z_coords,
-                mode='markers',
-                name=user_id,
-                marker=dict(
-                    size=6,
-                    color=colors[i % len(colors)],
-                    opacity=0.7
-                )
-            ))
-        
-        fig.update_layout(
-            title="3D Comparison by User",
-            scene=dict(
-                xaxis_title="Valence",
-                yaxis_title="Arousal",
-                zaxis_title="Dominance"
-            ),
-            height=400
-        )
+        df = thin_scatter(df)
+        fig = {
+            "data": [{
+                "type": "scatter3d",
+                "x": df["coords3d_v"].to_numpy(), "y": df["coords3d_a"].to_numpy(), "z": df["coords3d_d"].to_numpy(),
+                "mode": "markers",
+                "text": df["user_id"].to_numpy(),
+                "hovertemplate": '<b>%{text}</b><br>V: %{x:.3f}<br>A: %{y:.3f}<br>D: %{z:.3f}<extra></extra>',
+                "marker": {
+                    "size": 6,
+                    "color": user_colors(df["user_id"], self._user_color),
+                    "opacity": 0.7
+                }
+            }],
+            "layout": {
+                "title": {"text": "3D Comparison by User"},
+                "scene": {
+                    "xaxis": {"title": {"text": "Valence"}},
+                    "yaxis": {"title": {"text": "Arousal"}},
+                    "zaxis": {"title": {"text": "Dominance"}}
+                },
+                "height": 400
+            }
+        }
         
-        self.compare_3d_plot.options = fig.to_dict()
+        self.compare_3d_plot.update_figure(with_config(fig))
     
     def update_parallel_plot(self):
         """Update parallel coordinates plot"""
         if not self.compare_data:
             return
         
-        # Prepare data for parallel coordinates
-        all_data = []
+        # Prepare data for parallel coordinates: one row of scores per run
+        user_ids, rows = [], []
         for user_id, runs in self.compare_data.items():
             for run in runs:
                 if run.get("scores"):
-                    data_point = {"user_id": user_id}
-                    data_point.update(run["scores"])
-                    all_data.append(data_point)
+                    user_ids.append(user_id)
+                    rows.append(run["scores"])
         
-        if not all_data:
+        if not rows:
             return
         
-        # Convert to DataFrame
-        df = pd.DataFrame(all_data)
+        df = pd.DataFrame.from_records(rows)
+        mins, maxs = df.min(), df.max()
+        
+        # Discrete colorscale with one stop per user, in each user's colour
+        codes, users = pd.factorize(pd.Series(user_ids))
+        user_colors(users, self._user_color)
+        stops = max(len(users) - 1, 1)
+        colorscale = [[i / stops, self._user_color[user_id]] for i, user_id in enumerate(users)]
+        if len(users) == 1:
+            colorscale.append([1, colorscale[0][1]])
         
         # Create parallel coordinates plot
-        fig = go.Figure(data=
-            go.Parcoords(
-                line=dict(
-                    color=df['user_id'].astype('category').cat.codes,
-                    colorscale='Set1'
-                ),
-                dimensions=[
-                    dict(range=[df[col].min(), df[col].max()],
-                         label=col, values=df[col])
-                    for col in df.columns if col != 'user_id'
+        fig = {
+            "data": [{
+                "type": "parcoords",
+                "line": {
+                    "color": codes,
+                    "colorscale": colorscale,
+                    "cmin": 0,
+                    "cmax": stops
+                },
+                "dimensions": [
+                    {"range": [lo, maxs[col]], "label": col, "values": df[col].to_numpy()}
+                    for col, lo in mins.items()
                 ]
-            )
-        )
-        
-        fig.update_layout(
-            title="Parallel Coordinates by User",
-            height=350
-        )
+            }],
+            "layout": {
+                "title": {"text": "Parallel Coordinates by User"},
+                "height": 350
+            }
+        }
         
-        self.parallel_plot.options = fig.to_dict()
+        self.parallel_plot.update_figure(with_config(fig))
     
     # Embeddings Methods
-    def generate_projection(self):
+    async def generate_projection(self):
         """Generate projection visualization"""
         try:
             payload = {
@@ -920,15 +1185,10 @@ class NDSpectraUI:
                 "limit_per_user": 100
             }
             
-            response = requests.post(
-                f"{get_api_base()}/viz/project",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
+            response = await post_json("/viz/project", payload, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.embeddings_data["projection"] = data
                 self.update_projection_plots()
             else:
@@ -942,6 +1202,13 @@ class NDSpectraUI:
         projection = self.embeddings_data.get("projection")
         if not projection:
             return
+        sig = (
+            projection.get("technique"),
+            projection.get("dims"),
+            tuple(point.get("run_id") for point in projection.get("points", [])),
+        )
+        if self._plot_sig.get("projection") == sig:
+            return
         
         # Update main projection plot
         self.update_projection_plot(projection)
@@ -949,6 +1216,7 @@ class NDSpectraUI:
         # Update explained variance plot (for PCA)
         if projection.get("explained_variance"):
             self.update_variance_plot(projection["explained_variance"])
+        self._plot_sig["projection"] = sig
     
     def update_projection_plot(self, projection):
         """Update main projection plot"""
@@ -959,116 +1227,99 @@ class NDSpectraUI:
         dims = projection.get("dims", 2)
         technique = projection.get("technique", "pca")
         
+        # One pass over the payload, keeping only the plotted fields
+        df = thin_scatter(pd.DataFrame.from_records(points, columns=["user_id", "x", "y", "z"]))
+        colors = user_colors(df["user_id"], self._user_color)
+        user_ids = df["user_id"].to_numpy()
+        
         if dims == 2:
-            x_coords = [point["x"] for point in points]
-            y_coords = [point["y"] for point in points]
-            user_ids = [point["user_id"] for point in points]
-            
-            fig = go.Figure()
-            
-            # Color by user
-            unique_users = list(set(user_ids))
-            colors = px.colors.qualitative.Set1
-            
-            for i, user_id in enumerate(unique_users):
-                user_points = [j for j, uid in enumerate(user_ids) if uid == user_id]
-                user_x = [x_coords[j] for j in user_points]
-                user_y = [y_coords[j] for j in user_points]
-                
-                fig.add_trace(go.Scatter(
-                    x=user_x, y=user_y,
-                    mode='markers',
-                    name=user_id,
-                    marker=dict(
-                        size=8,
-                        color=colors[i % len(colors)],
-                        opacity=0.7
-                    )
-                ))
-            
-            fig.update_layout(
-                title=f"{technique.upper()} Projection (2D)",
-                xaxis_title="Component 1",
-                yaxis_title="Component 2",
-                height=400
-            )
+            # Single WebGL trace, coloured by user
+            fig = {
+                "data": [{
+                    "type": "scattergl",
+                    "x": df["x"].to_numpy(), "y": df["y"].to_numpy(),
+                    "mode": "markers",
+                    "text": user_ids,
+                    "hovertemplate": '<b>%{text}</b><extra></extra>',
+                    "marker": {
+                        "size": 8,
+                        "color": colors,
+                        "opacity": 0.7
+                    }
+                }],
+                "layout": {
+                    "title": {"text": f"{technique.upper()} Projection (2D)"},
+                    "xaxis": {"title": {"text": "Component 1"}},
+                    "yaxis": {"title": {"text": "Component 2"}},
+                    "height": 400
+                }
+            }
             
         else:  # 3D
-            x_coords = [point["x"] for point in points]
-            y_coords = [point["y"] for point in points]
-            z_coords = [point["z"] for point in points]
-            user_ids = [point["user_id"] for point in points]
-            
-            fig = go.Figure()
-            
-            # Color by user
-            unique_users = list(set(user_ids))
-            colors = px.colors.qualitative.Set1
-            
-            for i, user_id in enumerate(unique_users):
-                user_points = [j for j, uid in enumerate(user_ids) if uid == user_id]
-                user_x = [x_coords[j] for j in user_points]
-                user_y = [y_coords[j] for j in user_points]
-                user_z = [z_coords[j] for j in user_points]
-                
-                fig.add_trace(go.Scatter3d(
-                    x=user_x, y=user_y, z=user_z,
-                    mode='markers',
-                    name=user_id,
-                    marker=dict(
-                        size=6,
-                        color=colors[i % len(colors)],
-                        opacity=0.7
-                    )
-                ))
-            
-            fig.update_layout(
-                title=f"{technique.upper()} Projection (3D)",
-                scene=dict(
-                    xaxis_title="Component 1",
-                    yaxis_title="Component 2",
-                    zaxis_title="Component 3"
-                ),
-                height=400
-            )
+            fig = {
+                "data": [{
+                    "type": "scatter3d",
+                    "x": df["x"].to_numpy(), "y": df["y"].to_numpy(), "z": df["z"].to_numpy(),
+                    "mode": "markers",
+                    "text": user_ids,
+                    "hovertemplate": '<b>%{text}</b><extra></extra>',
+                    "marker": {
+                        "size": 6,
+                        "color": colors,
+                        "opacity": 0.7
+                    }
+                }],
+                "layout": {
+                    "title": {"text": f"{technique.upper()} Projection (3D)"},
+                    "scene": {
+                        "xaxis": {"title": {"text": "Component 1"}},
+                        "yaxis": {"title": {"text": "Component 2"}},
+                        "zaxis": {"title": {"text": "Component 3"}}
+                    },
+                    "height": 400
+                }
+            }
         
-        self.projection_plot.options = fig.to_dict()
+        self.projection_plot.update_figure(with_config(fig))
     
     def update_variance_plot(self, explained_variance):
         """Update explained variance plot"""
         if not explained_variance:
             return
         
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=[f"PC{i+1}" for i in range(len(explained_variance))],
-            y=explained_variance,
-            marker_color='lightblue'
-        ))
-        
-        fig.update_layout(
-            title="Explained Variance",
-            xaxis_title="Principal Components",
-            yaxis_title="Explained Variance Ratio",
-            height=300
-        )
+        fig = {
+            "data": [{
+                "type": "bar",
+                "x": [f"PC{i+1}" for i in range(len(explained_variance))],
+                "y": explained_variance,
+                "marker": {"color": "lightblue"}
+            }],
+            "layout": {
+                "title": {"text": "Explained Variance"},
+                "xaxis": {"title": {"text": "Principal Components"}},
+                "yaxis": {"title": {"text": "Explained Variance Ratio"}},
+                "height": 300
+            }
+        }
         
-        self.variance_plot.options = fig.to_dict()
+        self.variance_plot.update_figure(with_config(fig))
     
     # Diagnostics Methods
-    def load_diagnostics_data(self):
+    async def load_diagnostics_data(self):
         """Load data for diagnostics visualizations"""
         try:
-            # Load all runs for analysis
-            response = requests.get(
-                f"{get_api_base()}/runs",
-                params={"page_size": 1000},
-                timeout=10
+            # Correlations are computed by the API; only the latest page of
+            # runs is fetched for the corner and outlier plots
+            runs_response, corr_response = await asyncio.gather(
+                cached_get("/runs", params={"page_size": 100}),
+                cached_get("/runs/correlations"),
             )
             
-            if response.status_code == 200:
-                data = response.json()
+            if corr_response.status_code == 200:
+                self.update_correlation_plot(orjson.loads(corr_response.content))
+            
+            if runs_response.status_code == 200:
+                data = orjson.loads(runs_response.content)
                 runs = data.get("items", [])
                 
                 if runs:
@@ -1081,48 +1332,42 @@ class NDSpectraUI:
         """Update diagnostics plots"""
         if not runs:
             return
-        
-        # Update correlation plot
-        self.update_correlation_plot(runs)
+        sig = runs_signature(runs)
+        if self._plot_sig.get("diagnostics") == sig:
+            return
         
         # Update corner plot
         self.update_corner_plot(runs)
         
         # Update outlier plot
         self.update_outlier_plot(runs)
+        self._plot_sig["diagnostics"] = sig
     
-    def update_correlation_plot(self, runs):
-        """Update correlation heatmap"""
-        if not runs or not runs[0].get("scores"):
+    def update_correlation_plot(self, correlations):
+        """Update correlation heatmap from the API's correlation matrix"""
+        columns = correlations.get("columns", [])
+        if not columns:
             return
-        
-        # Extract scores for correlation analysis
-        scores_data = []
-        for run in runs:
-            if run.get("scores"):
-                scores_data.append(run["scores"])
-        
-        if len(scores_data) < 2:
+        if self._plot_sig.get("correlations") == correlations:
             return
         
-        # Create correlation matrix
-        df = pd.DataFrame(scores_data)
-        corr_matrix = df.corr()
-        
-        fig = go.Figure(data=go.Heatmap(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
-            colorscale='RdBu',
-            zmid=0
-        ))
-        
-        fig.update_layout(
-            title="Trait Correlations",
-            height=350
-        )
+        fig = {
+            "data": [{
+                "type": "heatmap",
+                "z": correlations["matrix"],
+                "x": columns,
+                "y": columns,
+                "colorscale": "RdBu",
+                "zmid": 0
+            }],
+            "layout": {
+                "title": {"text": "Trait Correlations"},
+                "height": 350
+            }
+        }
         
-        self.correlation_plot.options = fig.to_dict()
+        self.correlation_plot.update_figure(with_config(fig))
+        self._plot_sig["correlations"] = correlations
     
     def update_corner_plot(self, runs):
         """Update corner plot for trait distributions"""
@@ -1130,53 +1375,58 @@ class NDSpectraUI:
             return
         
         # Extract scores
-        scores_data = []
-        for run in runs:
-            if run.get("scores"):
-                scores_data.append(run["scores"])
+        df = pd.DataFrame.from_records([run["scores"] for run in runs if run.get("scores")])
         
-        if len(scores_data) < 2:
+        if len(df) < 2:
             return
         
-        df = pd.DataFrame(scores_data)
-        
         # Select top traits for visualization
         top_traits = df.columns[:6].tolist()  # Limit to 6 traits for readability
-        
-        # Create subplots
-        fig = make_subplots(
-            rows=len(top_traits), cols=len(top_traits),
-            subplot_titles=top_traits,
-            shared_xaxes=True, shared_yaxes=True
-        )
-        
-        for i, trait1 in enumerate(top_traits, 1):
-            for j, trait2 in enumerate(top_traits, 1):
+        n = len(top_traits)
+        values = df[top_traits].fillna(0).to_numpy(dtype=float)
+        
+        # Pre-binned cells on a manual grid: histograms on the diagonal,
+        # 2D histogram heatmaps off it, so the payload scales with bins not runs
+        data = []
+        layout = {
+            "title": {"text": "Trait Distributions and Relationships"},
+            "grid": {"rows": n, "columns": n, "pattern": "independent"},
+            "height": 500,
+            "showlegend": False
+        }
+        for i in range(n):
+            for j in range(n):
+                k = i * n + j + 1
+                axis = "" if k == 1 else str(k)
                 if i == j:
-                    # Histogram on diagonal
-                    fig.add_trace(
-                        go.Histogram(x=df[trait1], name=trait1, showlegend=False),
-                        row=i, col=j
-                    )
+                    counts, edges = np.histogram(values[:, j], bins=CORNER_BINS)
+                    data.append({
+                        "type": "bar",
+                        "x": (edges[:-1] + edges[1:]) / 2, "y": counts,
+                        "width": np.diff(edges),
+                        "name": top_traits[j],
+                        "xaxis": f"x{axis}", "yaxis": f"y{axis}"
+                    })
                 else:
-                    # Scatter plot off diagonal
-                    fig.add_trace(
-                        go.Scatter(
-                            x=df[trait1], y=df[trait2],
-                            mode='markers',
-                            marker=dict(size=4, opacity=0.6),
-                            showlegend=False
-                        ),
-                        row=i, col=j
-                    )
-        
-        fig.update_layout(
-            title="Trait Distributions and Relationships",
-            height=500,
-            showlegend=False
-        )
-        
-        self.corner_plot.options = fig.to_dict()
+                    counts, xedges, yedges = np.histogram2d(values[:, j], values[:, i], bins=CORNER_BINS)
+                    data.append({
+                        "type": "heatmap",
+                        "z": np.ascontiguousarray(counts.T),
+                        "x": (xedges[:-1] + xedges[1:]) / 2, "y": (yedges[:-1] + yedges[1:]) / 2,
+                        "colorscale": "Blues", "showscale": False,
+                        "xaxis": f"x{axis}", "yaxis": f"y{axis}"
+                    })
+                # Trait names only along the bottom row and left column
+                layout[f"xaxis{axis}"] = {"showticklabels": i == n - 1}
+                layout[f"yaxis{axis}"] = {"showticklabels": j == 0}
+                if i == n - 1:
+                    layout[f"xaxis{axis}"]["title"] = {"text": top_traits[j]}
+                if j == 0:
+                    layout[f"yaxis{axis}"]["title"] = {"text": top_traits[i]}
+        
+        fig = {"data": data, "layout": layout}
+        
+        self.corner_plot.update_figure(with_config(fig))
     
     def update_outlier_plot(self, runs):
         """Update outlier analysis plot"""
@@ -1184,52 +1434,66 @@ class NDSpectraUI:
             return
         
         # Extract stability values
-        stabilities = [run.get("stability", 0) for run in runs if run.get("stability") is not None]
+        stabilities = np.fromiter(
+            (run["stability"] for run in runs if run.get("stability") is not None),
+            dtype=np.float64
+        )
         
         if len(stabilities) < 2:
             return
         
         # Calculate statistics
-        mean_stability = np.mean(stabilities)
-        std_stability = np.std(stabilities)
-        
-        # Identify outliers (beyond 2 standard deviations)
-        outliers = [s for s in stabilities if abs(s - mean_stability) > 2 * std_stability]
-        normal = [s for s in stabilities if abs(s - mean_stability) <= 2 * std_stability]
+        mean_stability = float(stabilities.mean())
+        std_stability = float(stabilities.std())
         
-        fig = go.Figure()
+        # Identify outliers (beyond 2 standard deviations), keeping run indices
+        mask = np.abs(stabilities - mean_stability) > 2 * std_stability
+        normal_indices = np.flatnonzero(~mask)
+        outlier_indices = np.flatnonzero(mask)
         
         # Add normal points
-        fig.add_trace(go.Scatter(
-            x=list(range(len(normal))),
-            y=normal,
-            mode='markers',
-            name='Normal',
-            marker=dict(color='blue', size=8)
-        ))
+        data = [{
+            "type": "scatter",
+            "x": normal_indices,
+            "y": stabilities[~mask],
+            "mode": "markers",
+            "name": "Normal",
+            "marker": {"color": "blue", "size": 8}
+        }]
         
         # Add outliers
-        if outliers:
-            outlier_indices = [i for i, s in enumerate(stabilities) if abs(s - mean_stability) > 2 * std_stability]
-            fig.add_trace(go.Scatter(
-                x=outlier_indices,
-                y=outliers,
-                mode='markers',
-                name='Outliers',
-                marker=dict(color='red', size=12, symbol='x')
-            ))
-        
-        # Add mean line
-        fig.add_hline(y=mean_stability, line_dash="dash", line_color="gray", annotation_text="Mean")
+        if outlier_indices.size:
+            data.append({
+                "type": "scatter",
+                "x": outlier_indices,
+                "y": stabilities[mask],
+                "mode": "markers",
+                "name": "Outliers",
+                "marker": {"color": "red", "size": 12, "symbol": "x"}
+            })
         
-        fig.update_layout(
-            title="Stability Outlier Analysis",
-            xaxis_title="Run Index",
-            yaxis_title="Stability",
-            height=350
-        )
+        fig = {
+            "data": data,
+            "layout": {
+                "title": {"text": "Stability Outlier Analysis"},
+                "xaxis": {"title": {"text": "Run Index"}},
+                "yaxis": {"title": {"text": "Stability"}},
+                # Mean line across the full plot width
+                "shapes": [{
+                    "type": "line", "xref": "paper", "x0": 0, "x1": 1,
+                    "yref": "y", "y0": mean_stability, "y1": mean_stability,
+                    "line": {"dash": "dash", "color": "gray"}
+                }],
+                "annotations": [{
+                    "text": "Mean", "showarrow": False,
+                    "xref": "paper", "x": 1, "xanchor": "right",
+                    "yref": "y", "y": mean_stability, "yanchor": "bottom"
+                }],
+                "height": 350
+            }
+        }
         
-        self.outlier_plot.options = fig.to_dict()
+        self.outlier_plot.update_figure(with_config(fig))
 
 # Initialize UI
 nd_ui = NDSpectraUI()
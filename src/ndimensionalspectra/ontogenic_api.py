@@ -1,59 +1,123 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
+import orjson
+from functools import lru_cache
 from typing import Dict, Optional, Any, List
 from datetime import datetime
-from fastapi import FastAPI, Depends, Query, HTTPException
+from fastapi import FastAPI, Depends, Query, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from .ontogenic_schema import (
     build_simple_survey, score_responses, place_on_continuum,
     post_survey_install_run, json_schema
 )
-from .db import get_db, init_db, create_run, list_runs, get_run, compare_runs, get_runs_for_projection, get_run_stats
-from .models import RunCreate, RunRecord, RunList, CompareResponse, RunRequest, ScoreRequest, ProjectionRequest, ProjectionResult, ProjectionPoint, RunStats
+from .db import get_db, init_db, create_run, list_runs, decode_cursor, encode_cursor, get_run, compare_runs, get_runs_for_projection, get_run_stats, get_runs_version, get_score_correlations
+from .models import RunCreate, RunRecord, RunList, CompareResponse, RunRequest, ScoreRequest, ProjectionRequest, ProjectionResult, ProjectionPoint, RunStats, ScoreCorrelations
 
-app = FastAPI(title="Ontogenic Machine API", version="0.1.0")
+app = FastAPI(title="Ontogenic Machine API", version="0.1.0", default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
     init_db()
 
+@lru_cache(maxsize=1)
+def _survey():
+    """The survey is static; build it once and share it across handlers (read-only)"""
+    return build_simple_survey()
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def conditional_response(
+    request: Request, payload: Any, etag: Optional[str] = None, cache_control: Optional[str] = None
+) -> Response:
+    """Serialize ``payload`` with an ETag; 304 if the client already has it.
+
+    ``payload`` may be a model, a plain dict or pre-encoded JSON bytes. When
+    ``etag`` is known up front, ``payload`` may instead be a zero-argument
+    callable that is only invoked on a cache miss.
+    """
+    body = None
+    if etag is None:
+        body = _encode(payload)
+        etag = _etag(body)
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if body is None:
+        body = _encode(payload() if callable(payload) else payload)
+    return Response(body, media_type="application/json", headers=headers)
+
+def _encode(payload: Any) -> bytes:
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, BaseModel):
+        return payload.model_dump_json().encode()
+    return orjson.dumps(payload)
+
+def _static_body(payload: Any) -> tuple[bytes, str]:
+    body = orjson.dumps(payload)
+    return body, _etag(body)
+
+@lru_cache(maxsize=1)
+def _survey_document() -> tuple[bytes, str]:
+    """JSON body and ETag of the survey, encoded once"""
+    return _static_body(_survey().to_dict())
+
+@lru_cache(maxsize=8)
+def _schema_document(model: str) -> tuple[bytes, str]:
+    """JSON body and ETag of a model's JSON Schema, encoded once"""
+    return _static_body(json_schema(model))
+
+STATIC_CACHE_CONTROL = "public, max-age=300"
+
 @app.get("/health")
 def health_check():
     """Health check endpoint for Docker and load balancers."""
     return {"status": "healthy", "service": "ontogenic-machine-api"}
 
 @app.get("/schema/{model}")
-def get_schema(model: str):
-    return json_schema(model)
+def get_schema(request: Request, model: str):
+    body, etag = _schema_document(model)
+    return conditional_response(request, body, etag=etag, cache_control=STATIC_CACHE_CONTROL)
 
 @app.get("/survey")
-def get_survey():
-    return build_simple_survey().to_dict()
+def get_survey(request: Request):
+    body, etag = _survey_document()
+    return conditional_response(request, body, etag=etag, cache_control=STATIC_CACHE_CONTROL)
 
 @app.post("/score")
 def post_score(req: ScoreRequest):
-    survey = build_simple_survey()
+    survey = _survey()
     scores = score_responses(survey, req.responses)
     return {"scores": scores}
 
 @app.post("/place")
 def post_place(req: ScoreRequest):
-    survey = build_simple_survey()
+    survey = _survey()
     scores = score_responses(survey, req.responses)
     placement = place_on_continuum(scores)
     return {"scores": scores, "placement": placement.model_dump()}
 
-@app.post("/run")
+@app.post("/run", response_class=ORJSONResponse)
 def post_run(req: RunRequest, db: Session = Depends(get_db)):
     """Legacy endpoint - optionally persists if user_id provided"""
     res = post_survey_install_run(req.responses, passes=req.passes)
     
     # Optionally persist if user_id provided
     if req.user_id:
-        survey = build_simple_survey()
+        survey = _survey()
         create_run(
             session=db,
             user_id=req.user_id,
@@ -63,7 +127,8 @@ def post_run(req: RunRequest, db: Session = Depends(get_db)):
             pipeline_result=res
         )
     
-    return res
+    # Plain dict of JSON types: hand it to orjson directly, skipping jsonable_encoder
+    return ORJSONResponse(res)
 
 # New persistent endpoints
 @app.post("/runs", response_model=RunRecord)
@@ -73,7 +138,7 @@ def create_persistent_run(req: RunCreate, db: Session = Depends(get_db)):
     pipeline_result = post_survey_install_run(req.responses, passes=req.passes)
     
     # Get survey info
-    survey = build_simple_survey()
+    survey = _survey()
     
     # Persist the run
     run = create_run(
@@ -86,10 +151,12 @@ def create_persistent_run(req: RunCreate, db: Session = Depends(get_db)):
         notes=req.notes
     )
     
-    return run
+    # One Rust-side validate + dump instead of FastAPI's response_model round trip
+    return Response(RunRecord.model_validate(run).model_dump_json(), media_type="application/json")
 
 @app.get("/runs", response_model=RunList)
 def list_persistent_runs(
+    request: Request,
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     survey_id: Optional[str] = Query(None, description="Filter by survey ID"),
     page: int = Query(1, ge=1, description="Page number"),
@@ -97,9 +164,17 @@ def list_persistent_runs(
     since: Optional[datetime] = Query(None, description="Filter runs since this date"),
     until: Optional[datetime] = Query(None, description="Filter runs until this date"),
     include_state: bool = Query(False, description="Include final_state in response"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor (overrides page)"),
     db: Session = Depends(get_db)
 ):
     """List runs with filtering and pagination"""
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
     runs, total = list_runs(
         session=db,
         user_id=user_id,
@@ -108,18 +183,21 @@ def list_persistent_runs(
         page_size=page_size,
         since=since,
         until=until,
-        include_state=include_state
+        include_state=include_state,
+        after=after
     )
     
-    return RunList(
+    return conditional_response(request, RunList(
         items=runs,
         total=total,
         page=page,
-        page_size=page_size
-    )
+        page_size=page_size,
+        next_cursor=encode_cursor(runs[-1]) if len(runs) == page_size else None
+    ))
 
 @app.get("/runs/stats", response_model=RunStats)
 def get_stats(
+    request: Request,
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     survey_id: Optional[str] = Query(None, description="Filter by survey ID"),
     since: Optional[datetime] = Query(None, description="Filter runs since this date"),
@@ -127,16 +205,39 @@ def get_stats(
     db: Session = Depends(get_db)
 ):
     """Get statistics for runs"""
-    stats = get_run_stats(db, user_id, survey_id, since, until)
-    return RunStats(**stats)
+    # Stats only change when matching runs are added or removed, so the ETag
+    # comes from a cheap count/max(created_at) probe and the aggregation is
+    # skipped entirely on a 304
+    version = get_runs_version(db, user_id, survey_id, since, until)
+    etag = _etag(orjson.dumps([str(request.url.query), *version]))
+    return conditional_response(
+        request,
+        lambda: RunStats(**get_run_stats(db, user_id, survey_id, since, until)),
+        etag=etag,
+        cache_control="no-cache"
+    )
+
+@app.get("/runs/correlations", response_model=ScoreCorrelations)
+def get_correlations(
+    request: Request,
+    user_id: Optional[str] = Query(None, description="Filter by user ID"),
+    survey_id: Optional[str] = Query(None, description="Filter by survey ID"),
+    since: Optional[datetime] = Query(None, description="Filter runs since this date"),
+    until: Optional[datetime] = Query(None, description="Filter runs until this date"),
+    limit: int = Query(1000, ge=2, le=5000, description="Use at most this many of the most recent runs"),
+    db: Session = Depends(get_db)
+):
+    """Get the trait score correlation matrix for the most recent runs"""
+    correlations = get_score_correlations(db, user_id, survey_id, since, until, limit)
+    return conditional_response(request, ScoreCorrelations(**correlations))
 
 @app.get("/runs/{run_id}", response_model=RunRecord)
-def get_persistent_run(run_id: str, db: Session = Depends(get_db)):
+def get_persistent_run(request: Request, run_id: str, db: Session = Depends(get_db)):
     """Get a single run by ID"""
     run = get_run(db, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
-    return run
+    return conditional_response(request, RunRecord.model_validate(run))
 
 @app.get("/compare", response_model=CompareResponse)
 def compare_persistent_runs(
@@ -164,12 +265,64 @@ def compare_persistent_runs(
         limit_per_user=limit_per_user
     )
 
+# Fitted projections keyed on (technique, dims, shape, digest of X), so
+# repeated requests for the same runs skip the fit; least recently used last
+PROJECTION_CACHE_SIZE = 32
+_projection_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_projection_lock = threading.Lock()
+
+def _umap_available() -> bool:
+    try:
+        import umap  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _fit_projection(technique: str, dims: int, X):
+    """Fit ``technique`` on ``X`` (already validated), memoized on its contents.
+
+    Returns ``(coords, explained_variance)`` with ``coords`` read-only.
+    """
+    key = (technique, dims, X.shape, hashlib.blake2b(X.tobytes(), digest_size=16).digest())
+    with _projection_lock:
+        cached = _projection_cache.get(key)
+        if cached is not None:
+            _projection_cache.move_to_end(key)
+            return cached
+    
+    explained_variance = None
+    if technique == "pca":
+        from sklearn.decomposition import PCA
+        projector = PCA(n_components=dims)
+        coords = projector.fit_transform(X)
+        explained_variance = projector.explained_variance_ratio_.tolist() if dims == 2 else None
+    elif technique == "tsne":
+        from sklearn.manifold import TSNE
+        projector = TSNE(n_components=dims, perplexity=min(30, len(X)-1), random_state=42, n_jobs=-1)
+        coords = projector.fit_transform(X)
+    else:
+        import umap
+        projector = umap.UMAP(n_components=dims, n_neighbors=min(15, len(X)-1), min_dist=0.1, random_state=42)
+        coords = projector.fit_transform(X)
+    coords.flags.writeable = False
+    
+    with _projection_lock:
+        _projection_cache[key] = (coords, explained_variance)
+        while len(_projection_cache) > PROJECTION_CACHE_SIZE:
+            _projection_cache.popitem(last=False)
+    return coords, explained_variance
+
 @app.post("/viz/project", response_model=ProjectionResult)
 def project_runs(
     request: ProjectionRequest,
     db: Session = Depends(get_db)
 ):
     """Create projection visualization of runs"""
+    if request.technique not in ("pca", "tsne", "umap"):
+        raise HTTPException(status_code=400, detail="Invalid technique. Use 'pca', 'tsne', or 'umap'.")
+    if request.technique == "umap" and not _umap_available():
+        raise HTTPException(status_code=400, detail="UMAP not available. Install umap-learn package.")
+    
     try:
         # Get runs for projection
         runs = get_runs_for_projection(
@@ -192,77 +345,35 @@ def project_runs(
         # Prepare data for projection
         import numpy as np
         import pandas as pd
-        from sklearn.decomposition import PCA
-        from sklearn.manifold import TSNE
-        try:
-            import umap
-        except ImportError:
-            umap = None
-        
-        # Extract features from scores
-        feature_data = []
-        run_metadata = []
-        
-        for run in runs:
-            if run.scores:
-                # Use requested features or all available
-                if request.features:
-                    features = request.features
-                else:
-                    features = list(run.scores.keys())
-                
-                # Extract feature values, fill missing with 0
-                feature_vector = []
-                for feature in features:
-                    feature_vector.append(run.scores.get(feature, 0.0))
-                
-                feature_data.append(feature_vector)
-                run_metadata.append({
-                    'run_id': run.id,
-                    'user_id': run.user_id,
-                    'created_at': run.created_at,
-                    'stability': run.stability
-                })
         
-        if not feature_data:
+        # Extract features from scores in one frame; missing traits score 0
+        scored = [run for run in runs if run.scores]
+        if not scored:
             return ProjectionResult(
                 technique=request.technique,
                 dims=request.dims,
                 points=[],
-                feature_names=features if request.features else []
+                feature_names=request.features or []
             )
         
-        X = np.array(feature_data)
+        df = pd.DataFrame.from_records([run.scores for run in scored])
+        features = request.features or df.columns.tolist()
+        X = np.ascontiguousarray(df.reindex(columns=features).fillna(0.0).to_numpy(dtype=np.float64))
         
-        # Apply projection technique
-        if request.technique == "pca":
-            projector = PCA(n_components=request.dims)
-            coords = projector.fit_transform(X)
-            explained_variance = projector.explained_variance_ratio_.tolist() if request.dims == 2 else None
-        elif request.technique == "tsne":
-            projector = TSNE(n_components=request.dims, perplexity=min(30, len(X)-1), random_state=42)
-            coords = projector.fit_transform(X)
-            explained_variance = None
-        elif request.technique == "umap":
-            if umap is None:
-                raise HTTPException(status_code=400, detail="UMAP not available. Install umap-learn package.")
-            projector = umap.UMAP(n_components=request.dims, n_neighbors=min(15, len(X)-1), min_dist=0.1, random_state=42)
-            coords = projector.fit_transform(X)
-            explained_variance = None
-        else:
-            raise HTTPException(status_code=400, detail="Invalid technique. Use 'pca', 'tsne', or 'umap'.")
+        # Apply projection technique (memoized on the exact feature matrix)
+        coords, explained_variance = _fit_projection(request.technique, request.dims, X)
         
         # Create projection points
         points = []
-        for i, (coord, metadata) in enumerate(zip(coords, run_metadata)):
+        for coord, run in zip(coords, scored):
             point = ProjectionPoint(
-                run_id=metadata['run_id'],
-                user_id=metadata['user_id'],
-                created_at=metadata['created_at'],
+                run_id=str(run.id),
+                user_id=run.user_id,
+                created_at=run.created_at,
                 x=float(coord[0]),
                 y=float(coord[1]),
                 z=float(coord[2]) if request.dims == 3 else None,
-                meta={'stability': metadata['stability']}
+                meta={'stability': run.stability}
             )
             points.append(point)
         
@@ -271,7 +382,7 @@ def project_runs(
             dims=request.dims,
             points=points,
             explained_variance=explained_variance,
-            feature_names=features if request.features else list(runs[0].scores.keys()) if runs and runs[0].scores else []
+            feature_names=features
         )
         
     except Exception as e:
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import json
 import sys
+from pathlib import Path
+
 import click
+import orjson
 
 from .ontogenic_schema import (
     build_simple_survey, score_responses, place_on_continuum,
     post_survey_install_run, json_schema
 )
 
+def _print_json(obj) -> None:
+    print(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode())
+
 @click.group(name="om")
 def om():
     """Ontogenic Machine CLI: survey, score, place, run, schema."""
@@ -20,24 +26,29 @@ def om():
 @click.option("--model", type=click.Choice(["state","survey","hypergraph","all"]), default="all")
 def schema(model):
     """Print Pydantic JSON Schema."""
-    print(json.dumps(json_schema(model), indent=2))
+    _print_json(json_schema(model))
 
 @om.command()
 def survey():
     """Print survey JSON spec."""
     s = build_simple_survey()
-    print(json.dumps(s.to_dict(), indent=2))
+    _print_json(s.to_dict())
 
 def _load_responses(responses: str | None):
     if not responses or responses == "-":
-        data = sys.stdin.read()
-        return json.loads(data)
-    # try file path first
+        return orjson.loads(sys.stdin.buffer.read())
+    # try file path first, then assume inline JSON string
+    path = Path(responses)
+    try:
+        is_file = path.is_file()
+    except OSError:  # e.g. inline JSON longer than a valid file name
+        is_file = False
+    if is_file:
+        return orjson.loads(path.read_bytes())
     try:
-        with open(responses, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        # then assume inline JSON string
+        return orjson.loads(responses)
+    except orjson.JSONDecodeError:
+        # stdlib json accepts a little more (e.g. NaN) and raises the usual error
         return json.loads(responses)
 
 @om.command()
@@ -47,7 +58,7 @@ def score(responses):
     s = build_simple_survey()
     resp = _load_responses(responses)
     sc = score_responses(s, resp)
-    print(json.dumps(sc, indent=2))
+    _print_json(sc)
 
 @om.command()
 @click.option("--responses", "-r", help="Path/JSON/STDIN of responses")
@@ -57,7 +68,7 @@ def place(responses):
     resp = _load_responses(responses)
     sc = score_responses(s, resp)
     placement = place_on_continuum(sc)
-    print(json.dumps(placement.model_dump(), indent=2))
+    _print_json(placement.model_dump())
 
 @om.command()
 @click.option("--responses", "-r", help="Path/JSON/STDIN of responses")
@@ -66,7 +77,7 @@ def run(responses, passes):
     """Immediate post-survey install & run glyph engine."""
     resp = _load_responses(responses)
     out = post_survey_install_run(resp, passes=passes)
-    print(json.dumps(out, indent=2))
+    _print_json(out)
 
 if __name__ == "__main__":
     om()
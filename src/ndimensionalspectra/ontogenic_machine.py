@@ -1,18 +1,28 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from collections import deque
+from dataclasses import InitVar, dataclass, field
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 import json
 import math
-import random
+import sys
+
+import numpy as np
+
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the classes keep a __dict__
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Default number of log lines a State keeps; older lines are dropped
+HISTORY_CAP = 10_000
 
 
 # ===============
 # Core Data Model
 # ===============
 
-@dataclass
+@dataclass(**_SLOTS)
 class Presemantic:
     """
     Presemantic element (\u213cP): carries no required semantics.
@@ -22,18 +32,32 @@ class Presemantic:
     payload: Optional[Any] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HyperEdge:
     """
     Hyperedge: relates *sets* of Presemantic element ids to sets of ids.
+    Endpoints are frozensets of interned ids, so an edge's (src, dst) is hashable.
     meta can store local rules / weights without global axioms.
     """
-    src: Set[str]
-    dst: Set[str]
+    src: FrozenSet[str]
+    dst: FrozenSet[str]
     meta: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
+class HypergraphCSR:
+    """
+    Flat (structure-of-arrays) incidence view of a Hypergraph.
+    Edge e covers ids[offsets[e]:offsets[e+1]]; side is 0 for src, 1 for dst.
+    ids index into node_ids (graph nodes first, then endpoint-only ids).
+    """
+    node_ids: Tuple[str, ...]
+    ids: np.ndarray      # int32, one entry per incidence
+    offsets: np.ndarray  # int32, len(edges) + 1
+    side: np.ndarray     # int8, aligned with ids
+
+
+@dataclass(**_SLOTS)
 class Hypergraph:
     """
     Hypergraph-of-hypergraphs substrate (recursive allowed).
@@ -41,19 +65,164 @@ class Hypergraph:
     """
     nodes: Dict[str, Presemantic] = field(default_factory=dict)
     edges: List[HyperEdge] = field(default_factory=list)
+    # (src, dst) -> position in edges; internal, not part of the snapshot
+    _edge_index: Dict[Tuple[FrozenSet[str], FrozenSet[str]], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Cached to_csr() result, dropped by add_node/add_edge
+    _csr: Optional[HypergraphCSR] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Edges passed in may use plain sets/lists; normalize like add_edge
+        for i, e in enumerate(self.edges):
+            e.src = frozenset(map(sys.intern, e.src))
+            e.dst = frozenset(map(sys.intern, e.dst))
+            self._edge_index.setdefault((e.src, e.dst), i)
 
     def add_node(self, node: Presemantic) -> None:
-        self.nodes[node.id] = node
+        self.nodes[sys.intern(node.id)] = node
+        self._csr = None
+
+    def add_edge(self, src: Iterable[str], dst: Iterable[str], meta: Optional[Dict[str, Any]] = None) -> HyperEdge:
+        """Add (or return the existing) edge src -> dst; meta is merged into a duplicate."""
+        key = (frozenset(map(sys.intern, src)), frozenset(map(sys.intern, dst)))
+        i = self._edge_index.get(key)
+        if i is not None:
+            edge = self.edges[i]
+            if meta:
+                edge.meta.update(meta)
+            return edge
+        edge = HyperEdge(src=key[0], dst=key[1], meta=meta or {})
+        self._edge_index[key] = len(self.edges)
+        self.edges.append(edge)
+        self._csr = None
+        return edge
+
+    def find_edge(self, src: Iterable[str], dst: Iterable[str]) -> Optional[HyperEdge]:
+        """O(1) lookup of the edge with exactly these endpoints."""
+        i = self._edge_index.get((frozenset(src), frozenset(dst)))
+        return None if i is None else self.edges[i]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for snapshots; edge endpoints become sorted lists."""
+        return {
+            "nodes": {k: {"id": n.id, "payload": n.payload} for k, n in self.nodes.items()},
+            "edges": [{"src": sorted(e.src), "dst": sorted(e.dst), "meta": dict(e.meta)} for e in self.edges],
+        }
 
-    def add_edge(self, src: Set[str], dst: Set[str], meta: Optional[Dict[str, Any]] = None) -> None:
-        self.edges.append(HyperEdge(src=set(src), dst=set(dst), meta=meta or {}))
+    def to_csr(self) -> HypergraphCSR:
+        """
+        Incidence arrays for batch analytics, built once and cached until the
+        graph changes through add_node/add_edge.
+        """
+        if self._csr is None:
+            position = {node_id: i for i, node_id in enumerate(self.nodes)}
+            ids: List[int] = []
+            side: List[int] = []
+            offsets = [0]
+            for e in self.edges:
+                for flag, ends in ((0, e.src), (1, e.dst)):
+                    for node_id in ends:
+                        ids.append(position.setdefault(node_id, len(position)))
+                        side.append(flag)
+                offsets.append(len(ids))
+            self._csr = HypergraphCSR(
+                node_ids=tuple(position),
+                ids=np.array(ids, dtype=np.int32),
+                offsets=np.array(offsets, dtype=np.int32),
+                side=np.array(side, dtype=np.int8),
+            )
+        return self._csr
+
+    def degrees(self) -> np.ndarray:
+        """Incidence count per id, aligned with to_csr().node_ids."""
+        csr = self.to_csr()
+        return np.bincount(csr.ids, minlength=len(csr.node_ids))
 
 
 # =============
 # State Schema
 # =============
 
-@dataclass
+def materialize_counterfactual(cf: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Expand a stored counterfactual (shared base + delta, as generated by
+    PsiInvert) into standalone {"traits", "beliefs", "weight"} dicts.
+    Already-expanded counterfactuals are returned as-is.
+    """
+    if "trait_delta" not in cf:
+        return cf
+    return {
+        "traits": {**cf["base_traits"], **cf["trait_delta"]},
+        "beliefs": {**cf["base_beliefs"], **dict.fromkeys(cf["belief_set"], True)},
+        "weight": cf["weight"],
+    }
+
+
+class AbsenceTrackingDict(dict):
+    """
+    dict that keeps `absent`, the set of keys currently mapped to None,
+    up to date on every write, so absence (Δ∅) checks need no scan.
+    """
+    __slots__ = ("absent",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.absent: Set[str] = {k for k, v in self.items() if v is None}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild through __init__; the default dict protocol would replay
+        # items via __setitem__ before `absent` exists
+        return (type(self), (dict(self),))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        if value is None:
+            self.absent.add(key)
+        else:
+            self.absent.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.absent.discard(key)
+
+    def __ior__(self, other: Any) -> "AbsenceTrackingDict":
+        self.update(other)
+        return self
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        items = dict(*args, **kwargs)
+        super().update(items)
+        self.absent.difference_update(items)
+        self.absent.update(k for k, v in items.items() if v is None)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self.absent.discard(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        self.absent.discard(key)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self.absent.clear()
+
+
+def absent_keys(d: Dict[str, Any]) -> Set[str]:
+    """Keys of `d` mapped to None; O(1) for an AbsenceTrackingDict."""
+    if isinstance(d, AbsenceTrackingDict):
+        return d.absent
+    return {k for k, v in d.items() if v is None}
+
+
+@dataclass(**_SLOTS)
 class State:
     """
     Formal state the machine operates on.
@@ -68,6 +237,7 @@ class State:
       - tensions: paradox-stability registers (\u222e\u03a9\u2020 glyph)
       - ontologies: extensions forced by the unrepresentable ([\u2e2e] glyph)
       - hyper: presemantic hypergraph substrate
+      - history: log of the most recent `history_cap` messages
     """
     beliefs: Dict[str, Optional[Any]] = field(default_factory=dict)
     traits: Dict[str, float] = field(default_factory=dict)  # -1..1
@@ -78,19 +248,58 @@ class State:
     tensions: Dict[str, float] = field(default_factory=dict)
     ontologies: List[str] = field(default_factory=list)
     hyper: Hypergraph = field(default_factory=Hypergraph)
-    history: List[str] = field(default_factory=list)
+    history: Deque[str] = field(default_factory=deque)
+    # Source of randomness for glyphs and rules (see state_rng); if unset,
+    # OntogenicMachine binds its own
+    rng: Optional[np.random.Generator] = field(default=None, repr=False, compare=False)
+    # beliefs["anti_consistent_stability"] as a float, cached by OmegaContour
+    _stability: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    # Bitmask of MuDelta rules already installed in `rules` (MuDelta.REDUCE_EXTREMES, ...)
+    _rule_flags: int = field(default=0, init=False, repr=False, compare=False)
+    # Max history lines kept (None = unbounded)
+    history_cap: InitVar[Optional[int]] = HISTORY_CAP
+
+    def __post_init__(self, history_cap: Optional[int]) -> None:
+        if not (isinstance(self.history, deque) and self.history.maxlen == history_cap):
+            self.history = deque(self.history, maxlen=history_cap)
+        # Track structured absences as beliefs/traits are written
+        if not isinstance(self.beliefs, AbsenceTrackingDict):
+            self.beliefs = AbsenceTrackingDict(self.beliefs)
+        if not isinstance(self.traits, AbsenceTrackingDict):
+            self.traits = AbsenceTrackingDict(self.traits)
 
     def snapshot(self) -> Dict[str, Any]:
-        """JSON-friendly snapshot of current state."""
-        d = asdict(self)
-        # Drop callables for serialization
-        d["rules"] = [getattr(r, "__name__", "rule") for r in self.rules]
-        return d
+        """JSON-friendly snapshot of current state.
+
+        Built field by field rather than via dataclasses.asdict: containers are
+        copied one level deep (their values are scalars or treated as opaque)
+        and callables are never copied at all.
+        """
+        return {
+            "beliefs": dict(self.beliefs),
+            "traits": dict(self.traits),
+            "dual_traits": dict(self.dual_traits),
+            "memories": list(self.memories),
+            "counterfactuals": [materialize_counterfactual(cf) for cf in self.counterfactuals],
+            # Drop callables for serialization
+            "rules": [getattr(r, "__name__", "rule") for r in self.rules],
+            "tensions": dict(self.tensions),
+            "ontologies": list(self.ontologies),
+            "hyper": self.hyper.as_dict(),
+            "history": list(self.history),
+        }
 
     def log(self, msg: str) -> None:
         self.history.append(msg)
 
 
+def state_rng(s: State) -> np.random.Generator:
+    """The state's generator, creating an unseeded one for states run outside a machine."""
+    if s.rng is None:
+        s.rng = np.random.default_rng()
+    return s.rng
+
+
 # =====================
 # Glyph Implementations
 # =====================
@@ -110,12 +319,12 @@ class DeltaEmpty(Glyph):
     name = "DeltaEmpty"
 
     def apply(self, s: State) -> None:
-        absences = [k for k, v in s.beliefs.items() if v is None]
-        absences += [k for k, v in s.traits.items() if v is None]
-        for key in set(absences):
+        absences = sorted(absent_keys(s.beliefs) | absent_keys(s.traits))
+        for key in absences:
             node_id = f"absence::{key}"
-            s.hyper.add_node(Presemantic(node_id, payload={"kind": "absence", "key": key}))
-        s.log(f"[{self.name}] absences={sorted(set(absences))}")
+            if node_id not in s.hyper.nodes:  # seeded on an earlier pass otherwise
+                s.hyper.add_node(Presemantic(node_id, payload={"kind": "absence", "key": key}))
+        s.log(f"[{self.name}] absences={absences}")
 
 
 class LambdaNull(Glyph):
@@ -146,16 +355,25 @@ class PsiInvert(Glyph):
         # Select top-|value| traits to flip as counterfactual axes
         top = sorted(s.traits.items(), key=lambda kv: abs(kv[1]), reverse=True)[: self.k]
         keys = [k for k, _ in top]
-        absents = [k for k, v in s.beliefs.items() if v is None]
-
-        for i in range(self.samples):
-            cf_traits = dict(s.traits)
-            for k in keys:
-                cf_traits[k] = max(-1.0, min(1.0, -cf_traits[k] + random.uniform(-self.noise, self.noise)))
-            cf_beliefs = dict(s.beliefs)
-            for a in absents:
-                cf_beliefs[a] = True  # toggle a belief into existence
-            s.counterfactuals.append({"traits": cf_traits, "beliefs": cf_beliefs, "weight": 1.0 / self.samples})
+        absents = sorted(absent_keys(s.beliefs))
+
+        # Counterfactuals share one copy of the current traits/beliefs and
+        # store only what differs: the flipped axes and the toggled absences
+        base_traits, base_beliefs = dict(s.traits), dict(s.beliefs)
+        current = np.array([v for _, v in top], dtype=np.float64)
+        jitter = state_rng(s).uniform(-self.noise, self.noise, size=(self.samples, len(keys)))
+        flipped = jitter - current
+        np.clip(flipped, -1.0, 1.0, out=flipped)
+
+        belief_set = tuple(absents)  # toggled into existence
+        for row in flipped.tolist():
+            s.counterfactuals.append({
+                "base_traits": base_traits,
+                "base_beliefs": base_beliefs,
+                "trait_delta": dict(zip(keys, row)),
+                "belief_set": belief_set,
+                "weight": 1.0 / self.samples,
+            })
         s.log(f"[{self.name}] generated {self.samples} counterfactual(s) on axes={keys}")
 
 
@@ -166,6 +384,10 @@ class MuDelta(Glyph):
     """
     name = "MuDelta"
 
+    # Installation bits in State._rule_flags
+    REDUCE_EXTREMES = 1 << 0
+    CF_BLEND = 1 << 1
+
     @staticmethod
     def _rule_reduce_extremes(s: State) -> None:
         """Soften extreme opposing traits slightly toward bounded anti-consistent stability."""
@@ -181,18 +403,19 @@ class MuDelta(Glyph):
         """Blend in a weighted counterfactual to simulate learning from ghosts."""
         if not s.counterfactuals:
             return
-        cf = random.choice(s.counterfactuals)
+        cf = s.counterfactuals[state_rng(s).integers(len(s.counterfactuals))]
         w = cf.get("weight", 0.2)
-        for k, v in cf["traits"].items():
+        for k, v in materialize_counterfactual(cf)["traits"].items():
             s.traits[k] = max(-1.0, min(1.0, (1 - w) * s.traits.get(k, 0.0) + w * v))
 
     def apply(self, s: State) -> None:
-        # Install / rewrite rules (idempotently)
-        installed = {getattr(r, "__name__", "rule") for r in s.rules}
-        if "rule_reduce_extremes" not in installed:
+        # Install rules once per state (idempotently)
+        if not s._rule_flags & self.REDUCE_EXTREMES:
             s.rules.append(self._rule_reduce_extremes)
-        if "rule_counterfactual_blend" not in installed:
+            s._rule_flags |= self.REDUCE_EXTREMES
+        if not s._rule_flags & self.CF_BLEND:
             s.rules.append(self._rule_counterfactual_blend)
+            s._rule_flags |= self.CF_BLEND
         # Execute rules once this pass
         for r in s.rules:
             r(s)
@@ -209,8 +432,9 @@ class OmegaContour(Glyph):
     def apply(self, s: State) -> None:
         if not s.tensions:
             s.tensions["_baseline"] = 0.0
-        stability = 1.0 / (1.0 + sum(abs(v) for v in s.tensions.values()))
-        s.beliefs.setdefault("anti_consistent_stability", stability)
+        stability = 1.0 / (1.0 + sum(map(abs, s.tensions.values())))
+        current = s.beliefs.setdefault("anti_consistent_stability", stability)
+        s._stability = float(current or 0.0)
         s.log(f"[{self.name}] stability={stability:.4f}, tensions={len(s.tensions)}")
 
 
@@ -223,7 +447,9 @@ class UnknownGlyph(Glyph):
 
     def apply(self, s: State) -> None:
         # Simple heuristic: if no counterfactuals or low stability, add modality
-        stab = float(s.beliefs.get("anti_consistent_stability", 0.0) or 0.0)
+        stab = s._stability
+        if stab is None:  # OmegaContour has not run on this state
+            stab = float(s.beliefs.get("anti_consistent_stability", 0.0) or 0.0)
         if (not s.counterfactuals) or (stab < 0.5):
             new_mod = f"modality::{len(s.ontologies) + 1}"
             s.ontologies.append(new_mod)
@@ -243,7 +469,8 @@ class OntogenicMachine:
     The sequence corresponds to the protocol: \u0394\u2205 -> \u019b\u2298 -> \u03a8\u2183 -> \u2127\u0394 -> \u222e\u03a9\u2020 -> [\u2e2e]
     """
 
-    def __init__(self, glyphs: Optional[List[Glyph]] = None) -> None:
+    def __init__(self, glyphs: Optional[List[Glyph]] = None, seed: Optional[int] = None) -> None:
+        self._rng = np.random.default_rng(seed)
         self.glyphs: List[Glyph] = glyphs or [
             DeltaEmpty(),
             LambdaNull(),
@@ -255,6 +482,8 @@ class OntogenicMachine:
 
     def step(self, state: State) -> None:
         """Apply one pass of all glyphs in order."""
+        if state.rng is None:
+            state.rng = self._rng
         for g in self.glyphs:
             g.apply(state)
 
@@ -281,7 +510,7 @@ class OntogenicMachine:
                 "tensions": "Dict[str, float]",
                 "ontologies": "List[str]",
                 "hyper": "Hypergraph (nodes+hyperedges)",
-                "history": "List[str]",
+                "history": "Deque[str] (last HISTORY_CAP entries)",
             },
             "glyph_pipeline": [g.name for g in self.glyphs],
             "evaluation_protocol": "Self-modifying, contradiction-metabolizing; order-sensitive but extensible.",
@@ -309,4 +538,9 @@ def demo() -> Dict[str, Any]:
 
 if __name__ == "__main__":
     snap = demo()
-    print(json.dumps(snap, indent=2))
+    try:
+        import orjson
+    except ImportError:
+        print(json.dumps(snap, indent=2))
+    else:
+        print(orjson.dumps(snap, option=orjson.OPT_INDENT_2).decode())
@@ -1,9 +1,11 @@
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 from dataclasses import asdict, is_dataclass
-from pydantic import BaseModel, Field, field_validator, ConfigDict, ValidationError
+from pydantic import BaseModel, Field, field_validator, ConfigDict, ValidationError, PrivateAttr
 from pydantic.functional_validators import model_validator
 
 # ---------- Pydantic Models (Schema) ----------
@@ -101,8 +103,13 @@ class Survey(BaseModel):
     scale_max: int = 7
     items: List[SurveyItem]
 
+    _dict: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     def to_dict(self) -> Dict[str, Any]:
-        return self.model_dump()
+        """Plain-dict form, built once per survey (treat surveys and this dict as read-only)."""
+        if self._dict is None:
+            self._dict = self.model_dump()
+        return self._dict
 
 # ---------- Survey Construction ----------
 
@@ -131,24 +138,21 @@ def build_simple_survey() -> Survey:
 
 # ---------- Scoring ----------
 
-def _normalize_likert(x: int, lo: int, hi: int) -> float:
-    """Map Likert [lo..hi] to [-1,1]."""
-    if x < lo or x > hi:
-        raise ValueError(f"Likert response {x} out of bounds [{lo},{hi}]")
-    # center at midpoint, scale to [-1,1]
-    mid = (lo + hi) / 2.0
-    rng = (hi - lo) / 2.0
-    return (x - mid) / rng
-
 def score_responses(survey: Survey, responses: Dict[str, int]) -> Dict[str, float]:
     """Aggregate item responses into trait/PAD scores in [-1,1]."""
+    lo, hi = survey.scale_min, survey.scale_max
+    # Likert [lo..hi] -> [-1,1]: center at the midpoint, scale by half the range
+    mid = (lo + hi) / 2.0
+    half_range = (hi - lo) / 2.0
     acc: Dict[str, float] = {}
     wsum: Dict[str, float] = {}
     for item in survey.items:
         if item.id not in responses:
             continue
         raw = responses[item.id]
-        val = _normalize_likert(raw, survey.scale_min, survey.scale_max)
+        if raw < lo or raw > hi:
+            raise ValueError(f"Likert response {raw} out of bounds [{lo},{hi}]")
+        val = (raw - mid) / half_range
         if item.reverse:
             val = -val
         acc[item.maps_to] = acc.get(item.maps_to, 0.0) + val * item.weight
@@ -185,8 +189,20 @@ def place_on_continuum(scores: Dict[str, float]) -> ContinuumPlacement:
 
 # ---------- Bridge to Runtime Ontogenic Machine (optional) ----------
 
-def to_state_model(traits: Dict[str, float], beliefs: Optional[Dict[str, Optional[Any]]] = None) -> StateModel:
-    """Create a validated StateModel from scored traits/beliefs."""
+def to_state_model(
+    traits: Dict[str, float], beliefs: Optional[Dict[str, Optional[Any]]] = None, trusted: bool = False
+) -> StateModel:
+    """Create a validated StateModel from scored traits/beliefs.
+
+    ``trusted=True`` skips validation for traits this module produced itself
+    (e.g. score_responses output, already clamped to [-1, 1]).
+    """
+    if trusted:
+        return StateModel.model_construct(
+            traits=traits,
+            beliefs=beliefs or {},
+            dual_traits={k: -float(v) for k, v in traits.items()},
+        )
     return StateModel(traits=traits, beliefs=beliefs or {})
 
 # ---------- Example: Build Survey & Score a Mock Response ----------
@@ -234,7 +250,7 @@ def post_survey_install_run(responses: Dict[str, int], passes: int = 3) -> Dict[
         "coords2d": placement.coords2d,
         "coords3d": placement.coords3d,
         "notes": placement.notes,
-    })
+    }, trusted=True)
     # Bridge to runtime engine
     from .ontogenic_machine import State as RuntimeState, OntogenicMachine
     rt = RuntimeState(
@@ -248,7 +264,7 @@ def post_survey_install_run(responses: Dict[str, int], passes: int = 3) -> Dict[
         "scores": scores,
         "placement": placement.model_dump(),
         "final_state": final_state.snapshot(),
-        "history": final_state.history,
+        "history": list(final_state.history),
         "pipeline": {
             "survey_id": survey.id,
             "passes": passes,
@@ -277,6 +293,11 @@ def json_schema(model: str = "state") -> Dict[str, Any]:
     """Return Pydantic JSON Schema for a given model or a merged bundle.
     model in {"state", "survey", "hypergraph", "all"}
     """
+    # Schemas are generated once per process; callers get their own copy
+    return copy.deepcopy(_schema_for(model))
+
+@lru_cache(maxsize=8)
+def _schema_for(model: str) -> Dict[str, Any]:
     if model == "state":
         return StateModel.model_json_schema()
     if model == "survey":
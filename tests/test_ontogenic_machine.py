@@ -0,0 +1,17 @@
+from ndimensionalspectra.ontogenic_machine import HyperEdge, Hypergraph, OntogenicMachine, State
+
+
+def test_hypergraph_accepts_edges_with_plain_set_endpoints():
+    g = Hypergraph(edges=[HyperEdge(src={"a"}, dst={"b"})])
+    edge = g.edges[0]
+    assert edge.src == frozenset({"a"}) and isinstance(edge.src, frozenset)
+    assert edge.dst == frozenset({"b"}) and isinstance(edge.dst, frozenset)
+    assert g.find_edge({"a"}, {"b"}) is edge
+    assert g.add_edge(["a"], ["b"], {"w": 1}) is edge
+    assert edge.meta == {"w": 1}
+
+
+def test_mudelta_installs_each_rule_once():
+    state = State(traits={"kindness": 0.8, "aggression": -0.3})
+    OntogenicMachine(seed=0).run(state, passes=3)
+    assert [r.__name__ for r in state.rules] == ["_rule_reduce_extremes", "_rule_counterfactual_blend"]